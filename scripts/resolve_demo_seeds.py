@@ -5,17 +5,26 @@ import json
 import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 GAMMA_API_URL = "https://gamma-api.polymarket.com"
+_UA_HEADERS = {"User-Agent": "coinbot-alpha/0.1"}
 
 
 def _fetch_market(base_url: str, slug: str) -> dict[str, Any] | None:
     url = f"{base_url.rstrip('/')}/markets?{urllib.parse.urlencode({'slug': slug})}"
-    req = urllib.request.Request(url, headers={"User-Agent": "coinbot-alpha/0.1"})
+    req = urllib.request.Request(url, headers=_UA_HEADERS)
     with urllib.request.urlopen(req, timeout=10) as resp:
-        payload = json.loads(resp.read().decode("utf-8"))
+        payload = _loads(resp.read())
     if not isinstance(payload, list):
         return None
     for item in payload:
@@ -24,19 +33,64 @@ def _fetch_market(base_url: str, slug: str) -> dict[str, Any] | None:
     return None
 
 
+def _fetch_markets(base_url: str, slugs: list[str]) -> dict[str, dict[str, Any]]:
+    # Gamma accepts a repeated slug filter, so every candidate resolves in one round-trip.
+    query = urllib.parse.urlencode([("slug", slug) for slug in slugs])
+    url = f"{base_url.rstrip('/')}/markets?{query}"
+    req = urllib.request.Request(url, headers=_UA_HEADERS)
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        payload = _loads(resp.read())
+    if not isinstance(payload, list):
+        return {}
+    wanted = set(slugs)
+    out: dict[str, dict[str, Any]] = {}
+    for item in payload:
+        if isinstance(item, dict):
+            slug = str(item.get("slug") or "")
+            if slug in wanted:
+                out[slug] = item
+    return out
+
+
 def _find_latest_open_slug(base_url: str, family: str, interval_sec: int, lookback_bars: int = 48) -> str | None:
     now_ts = int(time.time())
     now_bucket = now_ts - (now_ts % interval_sec)
+    oldest_bucket = now_bucket - (lookback_bars + 1) * interval_sec
+    slugs = [f"{family}-{ts}" for ts in range(now_bucket, oldest_bucket, -interval_sec)]
 
-    for i in range(0, lookback_bars + 1):
-        ts = now_bucket - (i * interval_sec)
-        slug = f"{family}-{ts}"
-        item = _fetch_market(base_url, slug)
-        if not item:
-            continue
-        if bool(item.get("active", True)) and not bool(item.get("closed", False)):
-            return slug
-    return None
+    try:
+        by_slug = _fetch_markets(base_url, slugs)
+    except (OSError, ValueError):
+        # Batched filter rejected (HTTPError is an OSError) or unparseable: probe instead.
+        by_slug = {}
+
+    # The batch may be partial or hold only closed markets. Slugs it skipped ahead of its
+    # newest open one are probed, and any hit there is newer than the batch's answer.
+    batch_slug: str | None = None
+    missing: list[str] = []
+    for slug in slugs:
+        if slug not in by_slug:
+            missing.append(slug)
+        elif _is_open(by_slug[slug]):
+            batch_slug = slug
+            break
+    if not missing:
+        return batch_slug
+
+    # Probe the missing slugs concurrently, still preferring the newest.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # map() yields in submission order, i.e. newest bucket first.
+        for slug, item in executor.map(lambda slug: (slug, _fetch_market(base_url, slug)), missing):
+            if _is_open(item):
+                executor.shutdown(wait=False, cancel_futures=True)
+                return slug
+    return batch_slug
+
+
+def _is_open(item: dict[str, Any] | None) -> bool:
+    if not item:
+        return False
+    return bool(item.get("active", True)) and not bool(item.get("closed", False))
 
 
 def main() -> int:
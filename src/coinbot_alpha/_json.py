@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import simdjson
+except ModuleNotFoundError:  # pragma: no cover
+    simdjson = None
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+# Full materialization goes through orjson (fastest dict/list builder); on-demand
+# access goes through simdjson. Both fall back to stdlib json, so importing this
+# module never requires the optional extras.
+JSONDecodeError = json.JSONDecodeError
+
+# Accepts str or bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError.
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, separators=(",", ":"), default=default).encode("utf-8")
+
+
+def new_parser() -> Any | None:
+    return simdjson.Parser() if simdjson is not None else None
+
+
+def parse_lazy(raw: str | bytes, parser: Any | None = None) -> Any:
+    # A simdjson document is only valid until the same parser parses again;
+    # callers must copy out what they need (see project()) before the next call.
+    if parser is not None:
+        return parser.parse(raw.encode("utf-8") if isinstance(raw, str) else raw)
+    return loads(raw)
+
+
+def is_object(value: Any) -> bool:
+    return isinstance(value, dict) or (simdjson is not None and isinstance(value, simdjson.Object))
+
+
+def is_array(value: Any) -> bool:
+    return isinstance(value, list) or (simdjson is not None and isinstance(value, simdjson.Array))
+
+
+def project(item: Any, keys: tuple[str, ...]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for key in keys:
+        value = item.get(key)
+        if value is None:
+            continue
+        if simdjson is not None:
+            if isinstance(value, simdjson.Array):
+                value = value.as_list()
+            elif isinstance(value, simdjson.Object):
+                value = value.as_dict()
+        out[key] = value
+    return out
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 
 try:
     from dotenv import load_dotenv
@@ -14,6 +16,8 @@ except ModuleNotFoundError:  # pragma: no cover
 class AppConfig:
     mode: str = "paper"
     loop_interval_ms: int = 1000
+    audit_enabled: bool = True
+    audit_linger_ms: int = 0
 
 
 @dataclass(frozen=True)
@@ -35,6 +39,8 @@ class DemoConfig:
     clob_api_url: str = "https://gamma-api.polymarket.com"
     clob_ws_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
     binance_symbol: str = "BTCUSDT"
+    binance_poll_ms: int = 1000
+    binance_stale_sec: float = 10.0
     series_5m_prefix: str = "btc-updown-5m"
     series_15m_prefix: str = "btc-updown-15m"
     seed_5m_slug: str = "btc-updown-5m-1771549800"
@@ -64,61 +70,72 @@ class Settings:
     demo: DemoConfig
 
 
-def _get_bool(key: str, default: bool) -> bool:
-    raw = os.getenv(key)
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _get_bool(env: Mapping[str, str], key: str, default: bool) -> bool:
+    raw = env.get(key)
     if raw is None:
         return default
-    return raw.lower() in {"1", "true", "yes", "on"}
+    # First-character check rejects obvious negatives ("0", "false", "no") before lower().
+    return raw[:1] in "1tTyYoO" and raw.lower() in _TRUTHY
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
     load_dotenv()
+    # One snapshot of the environment instead of a getenv() round-trip per key.
+    env = dict(os.environ)
 
     settings = Settings(
         app=AppConfig(
-            mode=os.getenv("APP_MODE", AppConfig.mode),
-            loop_interval_ms=int(os.getenv("APP_LOOP_INTERVAL_MS", AppConfig.loop_interval_ms)),
+            mode=env.get("APP_MODE", AppConfig.mode),
+            loop_interval_ms=int(env.get("APP_LOOP_INTERVAL_MS", AppConfig.loop_interval_ms)),
+            audit_enabled=_get_bool(env, "APP_AUDIT_ENABLED", AppConfig.audit_enabled),
+            audit_linger_ms=int(env.get("APP_AUDIT_LINGER_MS", AppConfig.audit_linger_ms)),
         ),
         risk=RiskConfig(
             max_notional_per_symbol_usd=float(
-                os.getenv("RISK_MAX_NOTIONAL_PER_SYMBOL_USD", RiskConfig.max_notional_per_symbol_usd)
+                env.get("RISK_MAX_NOTIONAL_PER_SYMBOL_USD", RiskConfig.max_notional_per_symbol_usd)
             ),
             max_daily_notional_usd=float(
-                os.getenv("RISK_MAX_DAILY_NOTIONAL_USD", RiskConfig.max_daily_notional_usd)
+                env.get("RISK_MAX_DAILY_NOTIONAL_USD", RiskConfig.max_daily_notional_usd)
             ),
         ),
         execution=ExecutionConfig(
-            dry_run=_get_bool("EXECUTION_DRY_RUN", ExecutionConfig.dry_run),
-            slippage_bps=int(os.getenv("EXECUTION_SLIPPAGE_BPS", ExecutionConfig.slippage_bps)),
-            fee_bps=int(os.getenv("EXECUTION_FEE_BPS", ExecutionConfig.fee_bps)),
+            dry_run=_get_bool(env, "EXECUTION_DRY_RUN", ExecutionConfig.dry_run),
+            slippage_bps=int(env.get("EXECUTION_SLIPPAGE_BPS", ExecutionConfig.slippage_bps)),
+            fee_bps=int(env.get("EXECUTION_FEE_BPS", ExecutionConfig.fee_bps)),
         ),
         demo=DemoConfig(
-            enabled=_get_bool("DEMO_ENABLED", DemoConfig.enabled),
-            clob_api_url=os.getenv("DEMO_CLOB_API_URL", DemoConfig.clob_api_url),
-            clob_ws_url=os.getenv("DEMO_CLOB_WS_URL", DemoConfig.clob_ws_url),
-            binance_symbol=os.getenv("DEMO_BINANCE_SYMBOL", DemoConfig.binance_symbol),
-            series_5m_prefix=os.getenv("DEMO_SERIES_5M_PREFIX", DemoConfig.series_5m_prefix),
-            series_15m_prefix=os.getenv("DEMO_SERIES_15M_PREFIX", DemoConfig.series_15m_prefix),
-            seed_5m_slug=os.getenv("DEMO_SEED_5M_SLUG", DemoConfig.seed_5m_slug),
-            seed_15m_slug=os.getenv("DEMO_SEED_15M_SLUG", DemoConfig.seed_15m_slug),
-            market_refresh_sec=int(os.getenv("DEMO_MARKET_REFRESH_SEC", DemoConfig.market_refresh_sec)),
-            edge_threshold_bps=int(os.getenv("DEMO_EDGE_THRESHOLD_BPS", DemoConfig.edge_threshold_bps)),
-            signal_notional_usd=float(os.getenv("DEMO_SIGNAL_NOTIONAL_USD", DemoConfig.signal_notional_usd)),
-            model_sigma_annual=float(os.getenv("DEMO_MODEL_SIGMA_ANNUAL", DemoConfig.model_sigma_annual)),
-            signal_cooldown_sec=int(os.getenv("DEMO_SIGNAL_COOLDOWN_SEC", DemoConfig.signal_cooldown_sec)),
-            pos_stop_loss_usd=float(os.getenv("DEMO_POS_STOP_LOSS_USD", DemoConfig.pos_stop_loss_usd)),
-            pos_take_profit_usd=float(os.getenv("DEMO_POS_TAKE_PROFIT_USD", DemoConfig.pos_take_profit_usd)),
-            min_hold_sec_5m=int(os.getenv("DEMO_MIN_HOLD_SEC_5M", DemoConfig.min_hold_sec_5m)),
-            min_hold_sec_15m=int(os.getenv("DEMO_MIN_HOLD_SEC_15M", DemoConfig.min_hold_sec_15m)),
-            exit_edge_bps=int(os.getenv("DEMO_EXIT_EDGE_BPS", DemoConfig.exit_edge_bps)),
-            reentry_arm_bps=int(os.getenv("DEMO_REENTRY_ARM_BPS", DemoConfig.reentry_arm_bps)),
-            max_hold_sec_5m=int(os.getenv("DEMO_MAX_HOLD_SEC_5M", DemoConfig.max_hold_sec_5m)),
-            max_hold_sec_15m=int(os.getenv("DEMO_MAX_HOLD_SEC_15M", DemoConfig.max_hold_sec_15m)),
+            enabled=_get_bool(env, "DEMO_ENABLED", DemoConfig.enabled),
+            clob_api_url=env.get("DEMO_CLOB_API_URL", DemoConfig.clob_api_url),
+            clob_ws_url=env.get("DEMO_CLOB_WS_URL", DemoConfig.clob_ws_url),
+            binance_symbol=env.get("DEMO_BINANCE_SYMBOL", DemoConfig.binance_symbol),
+            binance_poll_ms=int(env.get("DEMO_BINANCE_POLL_MS", DemoConfig.binance_poll_ms)),
+            binance_stale_sec=float(env.get("DEMO_BINANCE_STALE_SEC", DemoConfig.binance_stale_sec)),
+            series_5m_prefix=env.get("DEMO_SERIES_5M_PREFIX", DemoConfig.series_5m_prefix),
+            series_15m_prefix=env.get("DEMO_SERIES_15M_PREFIX", DemoConfig.series_15m_prefix),
+            seed_5m_slug=env.get("DEMO_SEED_5M_SLUG", DemoConfig.seed_5m_slug),
+            seed_15m_slug=env.get("DEMO_SEED_15M_SLUG", DemoConfig.seed_15m_slug),
+            market_refresh_sec=int(env.get("DEMO_MARKET_REFRESH_SEC", DemoConfig.market_refresh_sec)),
+            edge_threshold_bps=int(env.get("DEMO_EDGE_THRESHOLD_BPS", DemoConfig.edge_threshold_bps)),
+            signal_notional_usd=float(env.get("DEMO_SIGNAL_NOTIONAL_USD", DemoConfig.signal_notional_usd)),
+            model_sigma_annual=float(env.get("DEMO_MODEL_SIGMA_ANNUAL", DemoConfig.model_sigma_annual)),
+            signal_cooldown_sec=int(env.get("DEMO_SIGNAL_COOLDOWN_SEC", DemoConfig.signal_cooldown_sec)),
+            pos_stop_loss_usd=float(env.get("DEMO_POS_STOP_LOSS_USD", DemoConfig.pos_stop_loss_usd)),
+            pos_take_profit_usd=float(env.get("DEMO_POS_TAKE_PROFIT_USD", DemoConfig.pos_take_profit_usd)),
+            min_hold_sec_5m=int(env.get("DEMO_MIN_HOLD_SEC_5M", DemoConfig.min_hold_sec_5m)),
+            min_hold_sec_15m=int(env.get("DEMO_MIN_HOLD_SEC_15M", DemoConfig.min_hold_sec_15m)),
+            exit_edge_bps=int(env.get("DEMO_EXIT_EDGE_BPS", DemoConfig.exit_edge_bps)),
+            reentry_arm_bps=int(env.get("DEMO_REENTRY_ARM_BPS", DemoConfig.reentry_arm_bps)),
+            max_hold_sec_5m=int(env.get("DEMO_MAX_HOLD_SEC_5M", DemoConfig.max_hold_sec_5m)),
+            max_hold_sec_15m=int(env.get("DEMO_MAX_HOLD_SEC_15M", DemoConfig.max_hold_sec_15m)),
             max_drawdown_soft_usd=float(
-                os.getenv("DEMO_MAX_DRAWDOWN_SOFT_USD", DemoConfig.max_drawdown_soft_usd)
+                env.get("DEMO_MAX_DRAWDOWN_SOFT_USD", DemoConfig.max_drawdown_soft_usd)
             ),
             max_drawdown_hard_usd=float(
-                os.getenv("DEMO_MAX_DRAWDOWN_HARD_USD", DemoConfig.max_drawdown_hard_usd)
+                env.get("DEMO_MAX_DRAWDOWN_HARD_USD", DemoConfig.max_drawdown_hard_usd)
             ),
         ),
     )
@@ -126,11 +143,18 @@ def load_settings() -> Settings:
     return settings
 
 
+def reload_settings() -> Settings:
+    load_settings.cache_clear()
+    return load_settings()
+
+
 def validate_settings(settings: Settings) -> None:
     if settings.app.mode not in {"paper", "live"}:
         raise ValueError("APP_MODE must be paper|live")
     if settings.app.loop_interval_ms <= 0:
         raise ValueError("APP_LOOP_INTERVAL_MS must be > 0")
+    if settings.app.audit_linger_ms < 0:
+        raise ValueError("APP_AUDIT_LINGER_MS must be >= 0")
     if settings.risk.max_notional_per_symbol_usd <= 0:
         raise ValueError("RISK_MAX_NOTIONAL_PER_SYMBOL_USD must be > 0")
     if settings.risk.max_daily_notional_usd <= 0:
@@ -145,6 +169,10 @@ def validate_settings(settings: Settings) -> None:
         raise ValueError("DEMO_CLOB_API_URL must be set")
     if not settings.demo.clob_ws_url:
         raise ValueError("DEMO_CLOB_WS_URL must be set")
+    if settings.demo.binance_poll_ms <= 0:
+        raise ValueError("DEMO_BINANCE_POLL_MS must be > 0")
+    if settings.demo.binance_stale_sec <= 0:
+        raise ValueError("DEMO_BINANCE_STALE_SEC must be > 0")
     if not settings.demo.seed_5m_slug:
         raise ValueError("DEMO_SEED_5M_SLUG must be set")
     if not settings.demo.seed_15m_slug:
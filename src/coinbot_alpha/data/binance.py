@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import json
+import logging
+import threading
+import time
 import urllib.parse
-import urllib.request
 from decimal import Decimal
 from urllib.error import HTTPError
 
+from coinbot_alpha._json import loads
+from coinbot_alpha.data.http_client import get_bytes
+
 
 class BinanceSpotClient:
     def __init__(self, symbol: str, base_urls: tuple[str, ...] | None = None) -> None:
@@ -14,17 +18,21 @@ class BinanceSpotClient:
             "https://api.binance.com",
             "https://api.binance.us",
         )
+        query = urllib.parse.urlencode({"symbol": self._symbol})
+        self._price_urls = tuple(f"{base}/api/v3/ticker/price?{query}" for base in self._base_urls)
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
 
     def get_price(self) -> Decimal:
-        query = urllib.parse.urlencode({"symbol": self._symbol})
         last_err: Exception | None = None
-        for base in self._base_urls:
-            url = f"{base}/api/v3/ticker/price?{query}"
-            req = urllib.request.Request(url, headers={"User-Agent": "coinbot-alpha/0.1"})
+        for url in self._price_urls:
             try:
-                with urllib.request.urlopen(req, timeout=3) as resp:
-                    payload = json.loads(resp.read().decode("utf-8"))
-                return Decimal(str(payload["price"]))
+                payload = loads(get_bytes(url, timeout=3))
+                raw = payload["price"]
+                # Binance quotes prices as JSON strings, which Decimal parses without a float hop.
+                return Decimal(raw) if isinstance(raw, str) else Decimal(str(raw))
             except HTTPError as exc:
                 last_err = exc
                 # Binance global returns 451 in restricted regions; continue to next venue.
@@ -37,3 +45,45 @@ class BinanceSpotClient:
         if last_err is not None:
             raise last_err
         raise RuntimeError("No Binance API endpoints configured")
+
+
+class BinanceSpotPoller:
+    def __init__(
+        self, client: BinanceSpotClient, interval_s: float, on_update: threading.Event | None = None
+    ) -> None:
+        self._client = client
+        self._interval_s = interval_s
+        self._on_update = on_update
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._log = logging.getLogger("coinbot_alpha.binance")
+        # (price, monotonic fetch time), written only by the poller thread. Rebinding one
+        # tuple is atomic in CPython, so readers always see a matching pair without a lock.
+        self._latest: tuple[Decimal, float] | None = None
+
+    def start(self) -> None:
+        thread = threading.Thread(target=self._run, name="binance_spot", daemon=True)
+        thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def wait_ready(self, timeout_s: float) -> bool:
+        return self._ready.wait(timeout_s)
+
+    def latest(self) -> tuple[Decimal, float] | None:
+        return self._latest
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                price = self._client.get_price()
+            except Exception as exc:  # noqa: BLE001
+                self._log.warning("binance_price_error symbol=%s err=%s", self._client.symbol, exc)
+            else:
+                prev = self._latest
+                self._latest = (price, time.monotonic())
+                self._ready.set()
+                if self._on_update is not None and (prev is None or prev[0] != price):
+                    self._on_update.set()
+            self._stop.wait(self._interval_s)
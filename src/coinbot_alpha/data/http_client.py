@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+import urllib.parse
+import urllib.request
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any
+from urllib.error import HTTPError
+
+try:
+    import h2  # noqa: F401  # httpx needs it for http2=True
+    import httpx
+except ModuleNotFoundError:  # pragma: no cover
+    httpx = None
+
+try:
+    import urllib3
+    from urllib3.util.retry import Retry
+except ModuleNotFoundError:  # pragma: no cover
+    urllib3 = None
+
+USER_AGENT = "coinbot-alpha/0.1"
+_BASE_HEADERS = {"User-Agent": USER_AGENT}
+# Two resolver threads can each fan out up to 8 slug probes; size the per-host pool so
+# those bursts keep their sockets alive instead of discarding them after each request.
+_MAX_CONNECTIONS_PER_HOST = 16
+
+# Preferred transport: a single HTTP/2 connection per host multiplexes concurrent
+# Gamma/CLOB requests instead of queueing them on HTTP/1.1 sockets.
+_h2_client = (
+    httpx.Client(
+        http2=True,
+        headers=_BASE_HEADERS,
+        limits=httpx.Limits(
+            max_connections=_MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=_MAX_CONNECTIONS_PER_HOST,
+        ),
+    )
+    if httpx is not None
+    else None
+)
+
+# Fallback: one keep-alive pool shared by the Binance and Gamma/CLOB clients so repeated
+# polls against the same hosts reuse TCP+TLS sessions. 429s are left to the
+# per-host RateLimiter instead of being retried blindly.
+_pool = (
+    urllib3.PoolManager(
+        maxsize=_MAX_CONNECTIONS_PER_HOST,
+        headers=_BASE_HEADERS,
+        retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    if urllib3 is not None
+    else None
+)
+
+
+class RateLimiter:
+    def __init__(self, default_backoff_s: float = 1.0, max_backoff_s: float = 60.0) -> None:
+        self._lock = threading.Lock()
+        self._default_backoff_s = default_backoff_s
+        self._max_backoff_s = max_backoff_s
+        self._blocked_until = 0.0
+        self._last_request = 0.0
+        self._last_success = 0.0
+        self._ewma_gap_s = 0.0
+        self._min_gap_s = 0.0
+        self._backoff_s = 0.0
+
+    def delay(self) -> float:
+        with self._lock:
+            ready_at = max(self._blocked_until, self._last_request + self._min_gap_s)
+            return max(0.0, ready_at - time.monotonic())
+
+    def wait(self, max_wait_s: float | None = None) -> bool:
+        delay = self.delay()
+        if max_wait_s is not None and delay > max_wait_s:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            self._last_request = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._last_success > 0:
+                gap = now - self._last_success
+                self._ewma_gap_s = gap if self._ewma_gap_s == 0 else 0.8 * self._ewma_gap_s + 0.2 * gap
+            self._last_success = now
+            # Relax pacing gradually once the server accepts requests again.
+            self._min_gap_s *= 0.9
+            self._backoff_s *= 0.5
+
+    def penalize(self, retry_after_s: float | None = None) -> None:
+        with self._lock:
+            if retry_after_s is not None and retry_after_s > 0:
+                backoff = retry_after_s
+            else:
+                backoff = max(self._default_backoff_s, self._backoff_s * 2)
+            backoff = min(backoff, self._max_backoff_s)
+            self._backoff_s = backoff
+            # Whatever rate we were sustaining was too fast; space requests out further.
+            self._min_gap_s = min(self._max_backoff_s, max(self._min_gap_s * 2, self._ewma_gap_s, 0.05))
+            jitter = random.uniform(0.0, 0.25 * backoff)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + backoff + jitter)
+
+
+# url -> (etag, body); lets unchanged payloads come back as an empty 304.
+_ETAG_CACHE_MAX = 256
+_etag_cache: dict[str, tuple[str, bytes]] = {}
+_etag_lock = threading.Lock()
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(url: str) -> RateLimiter:
+    host = urllib.parse.urlsplit(url).netloc
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter()
+            _limiters[host] = limiter
+        return limiter
+
+
+def get_bytes(url: str, timeout: float = 10) -> bytes:
+    limiter = limiter_for(url)
+    if not limiter.wait(max_wait_s=timeout):
+        # Still inside a server-imposed backoff window; fail fast so the caller retries next tick.
+        raise HTTPError(url, 429, "client_rate_limited", None, None)
+
+    with _etag_lock:
+        cached = _etag_cache.get(url)
+    headers = _BASE_HEADERS if cached is None else {**_BASE_HEADERS, "If-None-Match": cached[0]}
+
+    status, resp_headers, body = _request(url, headers, timeout)
+    if status == 304:
+        if cached is not None:
+            limiter.record_success()
+            return cached[1]
+        # Nothing was sent to validate, so there is no body to fall back on; an empty one
+        # would just fail to parse in the caller.
+        raise HTTPError(url, status, "not_modified_without_cached_body", resp_headers, None)
+    # Surface failures the same way urlopen does so callers can branch on HTTPError.code.
+    if status >= 400:
+        if status == 429:
+            limiter.penalize(_parse_retry_after(resp_headers.get("Retry-After") if resp_headers else None))
+        raise HTTPError(url, status, _reason(status), resp_headers, None)
+    limiter.record_success()
+    _remember_etag(url, resp_headers.get("ETag") if resp_headers else None, body)
+    return body
+
+
+def _request(url: str, headers: dict[str, str], timeout: float) -> tuple[int, Any, bytes]:
+    connect_timeout = min(2.0, timeout)
+    if _h2_client is not None:
+        resp = _h2_client.get(url, headers=headers, timeout=httpx.Timeout(timeout, connect=connect_timeout))
+        return resp.status_code, resp.headers, resp.content
+
+    if _pool is not None:
+        resp = _pool.request("GET", url, headers=headers, timeout=urllib3.Timeout(connect=connect_timeout, read=timeout))
+        return resp.status, resp.headers, resp.data
+
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.headers, resp.read()
+    except HTTPError as exc:
+        return exc.code, exc.headers, b""
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+def _remember_etag(url: str, etag: str | None, body: bytes) -> None:
+    if not etag:
+        return
+    with _etag_lock:
+        if url not in _etag_cache and len(_etag_cache) >= _ETAG_CACHE_MAX:
+            _etag_cache.pop(next(iter(_etag_cache)))
+        _etag_cache[url] = (etag, body)
+
+
+def _parse_retry_after(raw: Any) -> float | None:
+    if not raw:
+        return None
+    txt = str(raw).strip()
+    try:
+        return max(0.0, float(txt))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(txt).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -1,22 +1,57 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
 import threading
 import time
 import urllib.parse
-import urllib.request
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
+from coinbot_alpha._json import (
+    JSONDecodeError,
+    dumps,
+    is_array,
+    is_object,
+    loads,
+    new_parser,
+    parse_lazy,
+    project,
+)
+from coinbot_alpha.data.http_client import get_bytes
+
 try:
     import websocket
 except ModuleNotFoundError:  # pragma: no cover
     websocket = None
 
+_EPOCH_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
+# Matched against the lower-cased question, so no IGNORECASE and one scan for both phrasings.
+_STRIKE_RE = re.compile(r"(?:above|hit)\s+\$?([0-9][0-9,]*(?:\.[0-9]+)?[kmb]?)")
+_SLUG_TS_RE = re.compile(r".+-(\d{9,12})$")
+_SLUG_INTERVAL_RE = re.compile(r"-(\d+)m$")
+
+_YES_OUTCOMES = frozenset({"yes", "up"})
+_NO_OUTCOMES = frozenset({"no", "down"})
+
+_SAMPLING_CACHE_TTL_SEC = 60.0
+_SAMPLING_MAX_PAGES = 30
+# Family markets are listed contiguously; once some were seen, this many pages in a row
+# without one means the rest of the walk cannot contribute a candidate.
+_SAMPLING_EARLY_STOP_PAGES = 2
+_SLUG_CACHE_TTL_SEC = 5.0
+_SLUG_CACHE_MAX = 64
+
+# Only these keys are read downstream of the sampling-markets pager.
+_SAMPLING_MARKET_KEYS = ("market_slug", "condition_id", "question", "end_date_iso", "active", "closed", "tokens")
+
 
 @dataclass(frozen=True)
 class ActiveClobMarket:
@@ -24,54 +59,101 @@ class ActiveClobMarket:
     condition_id: str
     question: str
     end_ts: datetime
+    # end_ts as a POSIX timestamp, so the trading loop can compute time-to-expiry with
+    # one float subtraction against time.time().
+    end_ts_epoch: float
     yes_token_id: str
     no_token_id: str
     yes_price: Decimal
     no_price: Decimal
     strike_price: Decimal | None
+    # Classified once at resolve time so the trading loop never lowercases slug/question.
+    is_updown: bool
 
 
 class ClobSeriesResolver:
     def __init__(self, clob_api_url: str) -> None:
         self._base = clob_api_url.rstrip("/")
+        self._markets_url = f"{self._base}/markets"
+        self._sampling_markets_url = f"{self._base}/sampling-markets"
         self._family_last_slug: dict[str, str] = {}
+        # One simdjson parser per thread, reused across pages so it can recycle its buffers;
+        # resolve_from_seed may run for several series concurrently.
+        self._local = threading.local()
+        # Sampling pages change slowly; one lazily-extended walk is shared by every series
+        # for a minute. _sampling_cursor is None once the walk reached its last page.
+        self._sampling_walk: list[list[dict[str, Any]]] = []
+        self._sampling_cursor: str | None = None
+        self._sampling_started = float("-inf")
+        self._sampling_lock = threading.Lock()
+        # Short-lived per-slug memo so repeated probes within a tick skip the network.
+        self._slug_cache: dict[str, tuple[float, dict[str, Any] | None]] = {}
+        # Slug lookups run on pool workers, and two series can resolve at once.
+        self._slug_cache_lock = threading.Lock()
 
     def resolve_from_seed(self, seed_slug: str) -> ActiveClobMarket | None:
         family = _family_prefix(seed_slug)
         interval_sec = _slug_interval_seconds(seed_slug) or 300
 
-        for slug in self._candidate_slugs(family, seed_slug, interval_sec):
-            item = self._fetch_market_by_slug(slug)
-            if not item:
-                continue
-            if not bool(item.get("active", True)) or bool(item.get("closed", False)):
+        slugs = self._candidate_slugs(family, seed_slug, interval_sec)
+        try:
+            by_slug = self._fetch_markets_by_slugs(slugs)
+        except Exception:  # noqa: BLE001
+            # A rejected repeated-slug filter is no worse than an empty batch: probe instead.
+            by_slug = {}
+        # The batch may be partial (closed seed, a single honoured slug param, a truncated
+        # page). Candidates it skipped ahead of its best open market still outrank that one.
+        batch_market: ActiveClobMarket | None = None
+        missing: list[str] = []
+        for slug in slugs:
+            if slug not in by_slug:
+                missing.append(slug)
                 continue
-            market = _to_active_clob_market(item)
-            if market is not None:
-                self._family_last_slug[family] = market.slug
-                return market
-
-        # Fallback for legacy behavior on the CLOB sampling endpoint.
-        markets = self._fetch_sampling_markets()
-        candidates = [
-            m
-            for m in markets
-            if str(m.get("market_slug") or "").startswith(family + "-")
-            and bool(m.get("active", True))
-            and not bool(m.get("closed", False))
-        ]
-        if not candidates:
-            candidates = [
-                m
-                for m in markets
-                if str(m.get("market_slug") or "") == seed_slug
-                and bool(m.get("active", True))
-                and not bool(m.get("closed", False))
-        ]
-        if not candidates:
+            batch_market = _first_open_market((by_slug[slug],))
+            if batch_market is not None:
+                break
+        market = None
+        if missing:
+            # Probe those concurrently (urlopen releases the GIL) in candidate priority order.
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as pool:
+                market = _first_open_market(pool.map(self._fetch_market_by_slug, missing))
+                pool.shutdown(wait=False, cancel_futures=True)
+        if market is None:
+            market = batch_market
+        if market is not None:
+            self._family_last_slug[family] = market.slug
+            return market
+
+        # Fallback for legacy behavior on the CLOB sampling endpoint. The projected page
+        # walk (open markets only) is cached across series; a single pass keeps only the
+        # latest family/seed match.
+        prefix = family + "-"
+        family_best: tuple[datetime, dict[str, Any]] | None = None
+        seed_best: tuple[datetime, dict[str, Any]] | None = None
+        pages_since_hit = 0
+        for page in self._sampling_pages():
+            page_hit = False
+            for m in page:
+                slug = str(m.get("market_slug") or "")
+                if slug.startswith(prefix):
+                    page_hit = True
+                    ts = _parse_ts(m.get("end_date_iso")) or _EPOCH_MIN
+                    # >= keeps the later duplicate on ties, like the stable sort this replaced.
+                    if family_best is None or ts >= family_best[0]:
+                        family_best = (ts, m)
+                elif slug == seed_slug:
+                    ts = _parse_ts(m.get("end_date_iso")) or _EPOCH_MIN
+                    if seed_best is None or ts >= seed_best[0]:
+                        seed_best = (ts, m)
+            if family_best is not None:
+                pages_since_hit = 0 if page_hit else pages_since_hit + 1
+                if pages_since_hit >= _SAMPLING_EARLY_STOP_PAGES:
+                    break
+
+        best = family_best or seed_best
+        if best is None:
             return None
-        candidates.sort(key=lambda x: _parse_ts(x.get("end_date_iso")) or datetime.min.replace(tzinfo=timezone.utc))
-        market = _to_active_clob_market(candidates[-1])
+        market = _to_active_clob_market(best[1])
         if market is not None:
             self._family_last_slug[family] = market.slug
         return market
@@ -113,11 +195,40 @@ class ClobSeriesResolver:
             out.append(slug)
         return out
 
+    def _fetch_markets_by_slugs(self, slugs: list[str]) -> dict[str, dict[str, Any]]:
+        # Gamma accepts a repeated slug filter, so every candidate resolves in one round-trip.
+        query = urllib.parse.urlencode([("slug", slug) for slug in slugs])
+        url = f"{self._markets_url}?{query}"
+        payload = loads(get_bytes(url, timeout=10))
+
+        out: dict[str, dict[str, Any]] = {}
+        if not isinstance(payload, list):
+            return out
+        wanted = set(slugs)
+        for item in payload:
+            if not isinstance(item, dict):
+                continue
+            slug = str(item.get("slug") or "")
+            if slug in wanted:
+                out[slug] = _normalize_gamma_market(item)
+        return out
+
     def _fetch_market_by_slug(self, slug: str) -> dict[str, Any] | None:
-        url = f"{self._base}/markets?{urllib.parse.urlencode({'slug': slug})}"
-        req = urllib.request.Request(url, headers={"User-Agent": "coinbot-alpha/0.1"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
+        now = time.monotonic()
+        with self._slug_cache_lock:
+            cached = self._slug_cache.get(slug)
+        if cached is not None and now - cached[0] < _SLUG_CACHE_TTL_SEC:
+            return cached[1]
+        item = self._fetch_market_by_slug_uncached(slug)
+        with self._slug_cache_lock:
+            if len(self._slug_cache) >= _SLUG_CACHE_MAX:
+                self._slug_cache = {k: v for k, v in self._slug_cache.items() if now - v[0] < _SLUG_CACHE_TTL_SEC}
+            self._slug_cache[slug] = (now, item)
+        return item
+
+    def _fetch_market_by_slug_uncached(self, slug: str) -> dict[str, Any] | None:
+        url = f"{self._markets_url}?{urllib.parse.urlencode({'slug': slug})}"
+        payload = loads(get_bytes(url, timeout=10))
 
         if isinstance(payload, list):
             for item in payload:
@@ -133,34 +244,80 @@ class ClobSeriesResolver:
                         return item
         return None
 
-    def _fetch_sampling_markets(self) -> list[dict[str, Any]]:
-        cursor = "MA=="
-        out: list[dict[str, Any]] = []
-        for _ in range(30):
-            url = f"{self._base}/sampling-markets?{urllib.parse.urlencode({'next_cursor': cursor})}"
-            req = urllib.request.Request(url, headers={"User-Agent": "coinbot-alpha/0.1"})
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                payload = json.loads(resp.read().decode("utf-8"))
-
-            data = payload.get("data")
-            if isinstance(data, list):
-                out.extend([x for x in data if isinstance(x, dict)])
-
-            next_cursor = str(payload.get("next_cursor") or "")
-            if not next_cursor or next_cursor == cursor or next_cursor == "LTE=":
-                break
-            cursor = next_cursor
-        return out
+    def _sampling_pages(self) -> Iterator[list[dict[str, Any]]]:
+        # Replays the cached prefix of the walk and fetches further pages only on demand, so a
+        # caller that stops early leaves the remainder for whoever needs it next.
+        with self._sampling_lock:
+            now = time.monotonic()
+            if now - self._sampling_started >= _SAMPLING_CACHE_TTL_SEC:
+                self._sampling_walk = []
+                self._sampling_cursor = "MA=="
+                self._sampling_started = now
+            walk = self._sampling_walk
+        index = 0
+        while True:
+            with self._sampling_lock:
+                if index >= len(walk):
+                    # Stop if the walk was restarted under us or has no more pages.
+                    if walk is not self._sampling_walk or not self._extend_sampling_walk():
+                        return
+                page = walk[index]
+            yield page
+            index += 1
+
+    def _extend_sampling_walk(self) -> bool:
+        cursor = self._sampling_cursor
+        if cursor is None or len(self._sampling_walk) >= _SAMPLING_MAX_PAGES:
+            return False
+        url = f"{self._sampling_markets_url}?{urllib.parse.urlencode({'next_cursor': cursor})}"
+        page, next_cursor = self._parse_sampling_page(get_bytes(url, timeout=10))
+        self._sampling_walk.append(page)
+        if not next_cursor or next_cursor == cursor or next_cursor == "LTE=":
+            next_cursor = None
+        self._sampling_cursor = next_cursor
+        return True
+
+    def _parse_sampling_page(self, raw: bytes) -> tuple[list[dict[str, Any]], str]:
+        # With simdjson this is a lazy document: only the projected keys are materialized.
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = new_parser()
+        doc = parse_lazy(raw, parser)
+        if not is_object(doc):
+            return [], ""
+        data = doc.get("data")
+        # Closed/inactive markets are dropped before projection so the cached walk only
+        # holds candidates. The family filter stays with the caller since the walk is shared.
+        page = (
+            [project(x, _SAMPLING_MARKET_KEYS) for x in data if is_object(x) and _is_open(x)]
+            if is_array(data)
+            else []
+        )
+        return page, str(doc.get("next_cursor") or "")
 
 
 class ClobYesPriceFeed:
-    def __init__(self, ws_url: str, token_id: str, initial_price: Decimal | None = None) -> None:
+    def __init__(
+        self,
+        ws_url: str,
+        token_id: str,
+        initial_price: Decimal | float | None = None,
+        on_update: threading.Event | None = None,
+    ) -> None:
         self._ws_url = ws_url
         self._token_id = token_id
-        self._price = initial_price
-        self._lock = threading.Lock()
+        self._on_update = on_update
+        # Kept as float: the trading loop's decision math is float, so frames are parsed
+        # straight to it. Written only by the websocket thread and read by the main loop;
+        # rebinding one attribute to an immutable float is atomic in CPython, so no lock.
+        self._price = float(initial_price) if initial_price is not None else None
         self._stop = threading.Event()
         self._log = logging.getLogger("coinbot_alpha.clob_ws")
+        self._subscribe_frame = dumps(
+            {"type": "market", "assets_ids": [token_id], "asset_ids": [token_id]}
+        )
+        # Only the websocket thread parses, so one reusable simdjson parser per feed is safe.
+        self._parser = new_parser()
 
     def start(self) -> None:
         thread = threading.Thread(target=self._run, name=f"clob_ws_{self._token_id[:8]}", daemon=True)
@@ -169,13 +326,16 @@ class ClobYesPriceFeed:
     def stop(self) -> None:
         self._stop.set()
 
-    def latest_price(self) -> Decimal | None:
-        with self._lock:
-            return self._price
+    def latest_price(self) -> float | None:
+        return self._price
 
-    def _set_price(self, value: Decimal) -> None:
-        with self._lock:
-            self._price = value
+    def _set_price(self, value: float) -> None:
+        # Repeated quotes at the same price don't wake the trading loop.
+        if value == self._price:
+            return
+        self._price = value
+        if self._on_update is not None:
+            self._on_update.set()
 
     def _run(self) -> None:
         if websocket is None:
@@ -186,8 +346,9 @@ class ClobYesPriceFeed:
             ws = None
             try:
                 ws = websocket.create_connection(self._ws_url, timeout=8)
-                ws.send(json.dumps({"type": "market", "assets_ids": [self._token_id]}))
-                ws.send(json.dumps({"type": "market", "asset_ids": [self._token_id]}))
+                # One frame carrying both key spellings the server has accepted over time,
+                # instead of two back-to-back subscribe writes.
+                ws.send(self._subscribe_frame)
                 while not self._stop.is_set():
                     raw = ws.recv()
                     self._consume_message(raw)
@@ -201,53 +362,104 @@ class ClobYesPriceFeed:
                     except Exception:  # noqa: BLE001
                         pass
 
-    def _consume_message(self, raw: str) -> None:
+    def _consume_message(self, raw: str | bytes) -> None:
+        # With simdjson the frame is walked lazily: only the handful of keys
+        # _walk_message reads are ever turned into Python objects.
         try:
-            msg = json.loads(raw)
-        except json.JSONDecodeError:
+            msg = parse_lazy(raw, self._parser)
+        except ValueError:
             return
+        if is_object(msg) and msg.get("event_type") == "price_change":
+            # Most frames are flat price_change events with a string asset_id; handle them
+            # without the walker. Anything else (numeric or empty id, nested changes) goes
+            # through _walk_message so its id fallbacks and coercion still apply.
+            asset = msg.get("asset_id")
+            if type(asset) is str and asset and msg.get("changes") is None and msg.get("events") is None:
+                if asset == self._token_id:
+                    price = _extract_price(msg)
+                    if price is not None:
+                        self._set_price(price)
+                return
         self._walk_message(msg)
 
-    def _walk_message(self, msg: Any) -> None:
-        if isinstance(msg, list):
-            for item in msg:
-                self._walk_message(item)
-            return
-        if not isinstance(msg, dict):
-            return
+    def _walk_message(self, root: Any) -> None:
+        # Explicit stack instead of recursion. Children go on in reverse so prices are
+        # still applied in frame order and the last quote in a frame wins. Entries in a
+        # "changes" list carry their parent's asset id alongside them rather than in a copy.
+        stack: deque[tuple[Any, str]] = deque(((root, ""),))
+        while stack:
+            msg, inherited = stack.pop()
+            if is_array(msg):
+                stack.extend((item, "") for item in reversed(msg))
+                continue
+            if not is_object(msg):
+                continue
+
+            asset = inherited
+            if not asset:
+                # CLOB sends ids as strings; coerce only the odd numeric one.
+                asset = msg.get("asset_id") or msg.get("asset") or msg.get("token_id") or ""
+                if type(asset) is not str:
+                    asset = str(asset)
+            if asset == self._token_id:
+                price = _extract_price(msg)
+                if price is not None:
+                    self._set_price(price)
+
+            changes = msg.get("changes")
+            if is_array(changes):
+                stack.extend((item, asset) for item in reversed(changes) if is_object(item))
 
-        asset = str(msg.get("asset_id") or msg.get("asset") or msg.get("token_id") or "")
-        if asset and asset == self._token_id:
-            price = _extract_price(msg)
-            if price is not None:
-                self._set_price(price)
+            events = msg.get("events")
+            if is_array(events):
+                stack.extend((item, "") for item in reversed(events))
 
-        events = msg.get("events")
-        if isinstance(events, list):
-            for item in events:
-                self._walk_message(item)
 
-        changes = msg.get("changes")
-        if isinstance(changes, list):
-            for item in changes:
-                if isinstance(item, dict):
-                    payload = dict(item)
-                    payload["asset_id"] = asset or str(payload.get("asset_id") or "")
-                    self._walk_message(payload)
+def _is_open(item: Any) -> bool:
+    return bool(item.get("active", True)) and not bool(item.get("closed", False))
 
 
-def _extract_price(msg: dict[str, Any]) -> Decimal | None:
+def _first_open_market(items: Iterable[dict[str, Any] | None]) -> ActiveClobMarket | None:
+    for item in items:
+        if not item or not _is_open(item):
+            continue
+        market = _to_active_clob_market(item)
+        if market is not None:
+            return market
+    return None
+
+
+def _extract_price(msg: dict[str, Any]) -> float | None:
     for key in ("price", "best_bid", "best_ask"):
         raw = msg.get(key)
         if raw is None:
             continue
         try:
-            return Decimal(str(raw))
-        except Exception:  # noqa: BLE001
+            return float(raw)
+        except (TypeError, ValueError):
             continue
     return None
 
 
+def _to_decimal(raw: Any) -> Decimal:
+    # Gamma/CLOB prices usually arrive as JSON strings; only floats need the str() hop
+    # to avoid Decimal's exact binary expansion.
+    if isinstance(raw, Decimal):
+        return raw
+    if isinstance(raw, str):
+        return _decimal_from_str(raw)
+    if isinstance(raw, int):
+        return Decimal(raw)
+    return _decimal_from_str(str(raw))
+
+
+# Binary-market prices come from a small set of ticks (0.01..0.99), so the same
+# strings repeat on nearly every websocket frame. Decimal is immutable, so sharing is safe.
+@lru_cache(maxsize=512)
+def _decimal_from_str(txt: str) -> Decimal:
+    return Decimal(txt)
+
+
 def _to_active_clob_market(item: dict[str, Any]) -> ActiveClobMarket | None:
     slug = str(item.get("market_slug") or "")
     condition_id = str(item.get("condition_id") or "")
@@ -260,8 +472,7 @@ def _to_active_clob_market(item: dict[str, Any]) -> ActiveClobMarket | None:
     if not isinstance(tokens, list) or len(tokens) < 2:
         return None
 
-    yes = _pick_outcome(tokens, {"yes", "up"})
-    no = _pick_outcome(tokens, {"no", "down"})
+    yes, no = _pick_outcomes(tokens)
     if yes is None or no is None:
         return None
 
@@ -271,37 +482,70 @@ def _to_active_clob_market(item: dict[str, Any]) -> ActiveClobMarket | None:
         condition_id=condition_id,
         question=question,
         end_ts=end_ts,
+        end_ts_epoch=end_ts.timestamp(),
         yes_token_id=yes[0],
         no_token_id=no[0],
         yes_price=yes[1],
         no_price=no[1],
         strike_price=strike,
+        is_updown="updown" in slug.lower() or "up or down" in question.lower(),
     )
 
 
-def _pick_outcome(tokens: list[Any], names: set[str]) -> tuple[str, Decimal] | None:
-    targets = {x.lower() for x in names}
+def _pick_outcomes(tokens: list[Any]) -> tuple[tuple[str, Decimal] | None, tuple[str, Decimal] | None]:
+    # Single pass; as before, the first token labelled for a side decides that side.
+    yes: tuple[str, Decimal] | None = None
+    no: tuple[str, Decimal] | None = None
+    yes_seen = no_seen = False
     for token in tokens:
+        if yes_seen and no_seen:
+            break
         if not isinstance(token, dict):
             continue
         outcome = str(token.get("outcome") or "").strip().lower()
-        if outcome not in targets:
-            continue
-        token_id = str(token.get("token_id") or "")
-        if not token_id:
-            return None
-        try:
-            price = Decimal(str(token.get("price")))
-        except Exception:  # noqa: BLE001
-            return None
-        return token_id, price
-    return None
+        if not yes_seen and outcome in _YES_OUTCOMES:
+            yes_seen = True
+            yes = _token_quote(token)
+        elif not no_seen and outcome in _NO_OUTCOMES:
+            no_seen = True
+            no = _token_quote(token)
+    return yes, no
+
+
+def _token_quote(token: dict[str, Any]) -> tuple[str, Decimal] | None:
+    token_id = str(token.get("token_id") or "")
+    if not token_id:
+        return None
+    try:
+        price = _to_decimal(token.get("price"))
+    except Exception:  # noqa: BLE001
+        return None
+    return token_id, price
 
 
 def _parse_ts(raw: Any) -> datetime | None:
     if not raw:
         return None
-    txt = str(raw)
+    return _parse_ts_text(str(raw))
+
+
+# End dates repeat across refresh cycles, so nearly every lookup after the first is a hit.
+@lru_cache(maxsize=4096)
+def _parse_ts_text(txt: str) -> datetime | None:
+    # Fast path for the fixed "YYYY-MM-DDTHH:MM:SSZ" shape Gamma and CLOB emit.
+    if len(txt) == 20 and txt[19] == "Z" and txt[10] == "T" and txt[4] == txt[7] == "-" and txt[13] == txt[16] == ":":
+        try:
+            return datetime(
+                int(txt[0:4]),
+                int(txt[5:7]),
+                int(txt[8:10]),
+                int(txt[11:13]),
+                int(txt[14:16]),
+                int(txt[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
     try:
         if txt.endswith("Z"):
             txt = txt[:-1] + "+00:00"
@@ -311,12 +555,10 @@ def _parse_ts(raw: Any) -> datetime | None:
 
 
 def _parse_strike_price(question: str) -> Decimal | None:
-    m = re.search(r"above\s+\$?([0-9][0-9,]*(?:\.[0-9]+)?[kKmMbB]?)", question, flags=re.IGNORECASE)
-    if not m:
-        m = re.search(r"hit\s+\$?([0-9][0-9,]*(?:\.[0-9]+)?[kKmMbB]?)", question, flags=re.IGNORECASE)
+    m = _STRIKE_RE.search(question.lower())
     if not m:
         return None
-    num = m.group(1).replace(",", "").lower()
+    num = m.group(1).replace(",", "")
     mult = Decimal("1")
     if num.endswith("k"):
         mult = Decimal("1000")
@@ -338,7 +580,7 @@ def _family_prefix(slug: str) -> str:
 
 
 def _slug_timestamp(slug: str) -> int | None:
-    m = re.match(r".+-(\d{9,12})$", slug)
+    m = _SLUG_TS_RE.match(slug)
     if not m:
         return None
     try:
@@ -349,7 +591,7 @@ def _slug_timestamp(slug: str) -> int | None:
 
 def _slug_interval_seconds(seed_slug: str) -> int | None:
     family = _family_prefix(seed_slug)
-    m = re.search(r"-(\d+)m$", family)
+    m = _SLUG_INTERVAL_RE.search(family)
     if not m:
         return None
     try:
@@ -362,6 +604,22 @@ def _slug_interval_seconds(seed_slug: str) -> int | None:
 
 
 def _normalize_gamma_market(item: dict[str, Any]) -> dict[str, Any]:
+    out: dict[str, Any] = {
+        "market_slug": str(item.get("slug") or ""),
+        "condition_id": str(item.get("conditionId") or ""),
+        "question": str(item.get("question") or ""),
+        "end_date_iso": item.get("endDate"),
+        "active": bool(item.get("active", True)),
+        "closed": bool(item.get("closed", False)),
+        "tokens": [],
+    }
+    # Outcomes, prices and token ids are JSON-in-JSON strings; skip decoding them
+    # for markets that _to_active_clob_market would reject anyway.
+    if not out["active"] or out["closed"] or not out["market_slug"] or not out["condition_id"]:
+        return out
+    if not out["end_date_iso"] or not _may_have_yes_outcome(item.get("outcomes")):
+        return out
+
     token_ids = _parse_json_string_list(item.get("clobTokenIds"))
     outcomes = _parse_json_string_list(item.get("outcomes"))
     prices_raw = _parse_json_string_list(item.get("outcomePrices"))
@@ -369,7 +627,7 @@ def _normalize_gamma_market(item: dict[str, Any]) -> dict[str, Any]:
     prices: list[Decimal] = []
     for raw in prices_raw:
         try:
-            prices.append(Decimal(str(raw)))
+            prices.append(_to_decimal(raw))
         except Exception:  # noqa: BLE001
             prices.append(Decimal("0"))
 
@@ -377,16 +635,15 @@ def _normalize_gamma_market(item: dict[str, Any]) -> dict[str, Any]:
     for idx in range(min(len(token_ids), len(outcomes))):
         price = prices[idx] if idx < len(prices) else Decimal("0")
         tokens.append({"token_id": str(token_ids[idx]), "outcome": str(outcomes[idx]), "price": price})
+    out["tokens"] = tokens
+    return out
 
-    return {
-        "market_slug": str(item.get("slug") or ""),
-        "condition_id": str(item.get("conditionId") or ""),
-        "question": str(item.get("question") or ""),
-        "end_date_iso": item.get("endDate"),
-        "active": bool(item.get("active", True)),
-        "closed": bool(item.get("closed", False)),
-        "tokens": tokens,
-    }
+
+def _may_have_yes_outcome(raw: Any) -> bool:
+    if not isinstance(raw, str):
+        return True
+    lowered = raw.lower()
+    return "yes" in lowered or "up" in lowered
 
 
 def _parse_json_string_list(value: Any) -> list[Any]:
@@ -394,8 +651,8 @@ def _parse_json_string_list(value: Any) -> list[Any]:
         return value
     if isinstance(value, str):
         try:
-            decoded = json.loads(value)
-        except json.JSONDecodeError:
+            decoded = loads(value)
+        except JSONDecodeError:
             return []
         return decoded if isinstance(decoded, list) else []
     return []
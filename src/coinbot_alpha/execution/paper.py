@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
 from decimal import Decimal
 
 from coinbot_alpha.schemas import OrderIntent
 
+_MIN_PRICE = 0.0001
+_ZERO = Decimal("0")
+
 
 @dataclass(frozen=True)
 class PaperFill:
@@ -32,185 +36,203 @@ class PaperLedgerSnapshot:
     fee_paid_total: Decimal
 
 
+@dataclass(slots=True)
+class _Pos:
+    qty: float
+    avg: float
+    mark: float
+
+
 class PaperExecutor:
     def __init__(self, fee_bps: int = 0) -> None:
         self._log = logging.getLogger("PaperExecutor")
-        self._position_qty: dict[str, Decimal] = {}
-        self._avg_entry_price: dict[str, Decimal] = {}
-        self._marks: dict[str, Decimal] = {}
-        self._realized_pnl_total = Decimal("0")
+        # Ledger state is carried in float; Decimal only appears at the PaperFill/snapshot boundary.
+        self._positions: dict[str, _Pos] = {}
+        self._realized_pnl_total = 0.0
         self._fee_bps = max(0, int(fee_bps))
-        self._fee_paid_total = Decimal("0")
+        self._fee_paid_total = 0.0
         self._trades_total = 0
 
-    def submit(self, intent: OrderIntent, fill_price: Decimal) -> PaperFill:
-        price = max(fill_price, Decimal("0.0001"))
-        qty = intent.notional_usd / price
+    def submit(self, intent: OrderIntent, fill_price: Decimal | float) -> PaperFill:
+        price = max(float(fill_price), _MIN_PRICE)
+        notional = float(intent.notional_usd)
+        qty = notional / price
         signed_qty = qty if intent.side.value == "BUY" else -qty
 
-        current_qty = self._position_qty.get(intent.symbol, Decimal("0"))
-        current_avg = self._avg_entry_price.get(intent.symbol, Decimal("0"))
-        realized_delta = Decimal("0")
+        pos = self._positions.get(intent.symbol)
+        if pos is None:
+            pos = self._positions[intent.symbol] = _Pos(0.0, 0.0, price)
+        current_qty = pos.qty
+        current_avg = pos.avg
+        realized_delta = 0.0
 
         if current_qty == 0 or (current_qty > 0 and signed_qty > 0) or (current_qty < 0 and signed_qty < 0):
             next_qty = current_qty + signed_qty
             next_avg = _weighted_avg(current_qty, current_avg, signed_qty, price)
         else:
-            closing_qty = min(abs(current_qty), abs(signed_qty))
+            # Opposite signs here, so |signed_qty| is just qty.
+            current_abs = -current_qty if current_qty < 0 else current_qty
+            closing_qty = current_abs if current_abs < qty else qty
             if current_qty > 0:
                 realized_delta = (price - current_avg) * closing_qty
             else:
                 realized_delta = (current_avg - price) * closing_qty
 
-            if abs(current_qty) > abs(signed_qty):
+            if current_abs > qty:
                 next_qty = current_qty + signed_qty
                 next_avg = current_avg
-            elif abs(current_qty) == abs(signed_qty):
-                next_qty = Decimal("0")
-                next_avg = Decimal("0")
+            elif current_abs == qty:
+                next_qty = 0.0
+                next_avg = 0.0
             else:
                 next_qty = current_qty + signed_qty
                 next_avg = price
 
-        self._position_qty[intent.symbol] = next_qty
-        self._avg_entry_price[intent.symbol] = next_avg
-        self._marks[intent.symbol] = price
-        fee_paid = _fee_from_notional(intent.notional_usd, self._fee_bps)
+        pos.qty = next_qty
+        pos.avg = next_avg
+        pos.mark = price
+        fee_paid = _fee_from_notional(notional, self._fee_bps)
         realized_delta_after_fee = realized_delta - fee_paid
         self._realized_pnl_total += realized_delta_after_fee
         self._fee_paid_total += fee_paid
         self._trades_total += 1
 
-        self._log.info(
-            "paper_submit symbol=%s side=%s notional=%s px=%s qty=%s pos_qty=%s realized_delta=%s fee=%s realized_total=%s trades_total=%s",
-            intent.symbol,
-            intent.side.value,
-            intent.notional_usd,
-            price,
-            qty,
-            next_qty,
-            realized_delta_after_fee,
-            fee_paid,
-            self._realized_pnl_total,
-            self._trades_total,
-        )
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info(
+                "paper_submit symbol=%s side=%s notional=%s px=%s qty=%s pos_qty=%s realized_delta=%s fee=%s realized_total=%s trades_total=%s",
+                intent.symbol,
+                intent.side.value,
+                intent.notional_usd,
+                price,
+                qty,
+                next_qty,
+                realized_delta_after_fee,
+                fee_paid,
+                self._realized_pnl_total,
+                self._trades_total,
+            )
         return PaperFill(
             intent_id=intent.intent_id,
             symbol=intent.symbol,
             side=intent.side.value,
             notional_usd=intent.notional_usd,
-            fill_price=price,
-            qty=qty,
-            position_qty_after=next_qty,
-            avg_entry_price_after=next_avg,
-            realized_pnl_delta=realized_delta_after_fee,
-            realized_pnl_total=self._realized_pnl_total,
-            fee_paid=fee_paid,
+            fill_price=_to_decimal(price),
+            qty=_to_decimal(qty),
+            position_qty_after=_to_decimal(next_qty),
+            avg_entry_price_after=_to_decimal(next_avg),
+            realized_pnl_delta=_to_decimal(realized_delta_after_fee),
+            realized_pnl_total=_to_decimal(self._realized_pnl_total),
+            fee_paid=_to_decimal(fee_paid),
             status="filled",
         )
 
-    def snapshot(self, marks: dict[str, Decimal] | None = None) -> PaperLedgerSnapshot:
+    def snapshot(self, marks: Mapping[str, Decimal | float] | None = None) -> PaperLedgerSnapshot:
         if marks:
-            self._marks.update(marks)
+            for symbol, mark in marks.items():
+                pos = self._positions.get(symbol)
+                if pos is not None:
+                    pos.mark = float(mark)
 
-        unrealized_total = Decimal("0")
+        unrealized_total = 0.0
         open_positions = 0
-        for symbol, qty in self._position_qty.items():
+        for pos in self._positions.values():
+            qty = pos.qty
             if qty == 0:
                 continue
-            mark = self._marks.get(symbol)
-            if mark is None:
-                continue
-            avg = self._avg_entry_price.get(symbol, Decimal("0"))
-            if qty > 0:
-                unrealized_total += (mark - avg) * qty
-            else:
-                unrealized_total += (avg - mark) * abs(qty)
+            # (mark - avg) * qty covers both sides: for shorts both factors flip sign.
+            unrealized_total += (pos.mark - pos.avg) * qty
             open_positions += 1
 
         return PaperLedgerSnapshot(
-            realized_pnl_total=self._realized_pnl_total,
-            unrealized_pnl_total=unrealized_total,
+            realized_pnl_total=_to_decimal(self._realized_pnl_total),
+            unrealized_pnl_total=_to_decimal(unrealized_total),
             open_positions=open_positions,
             trades_total=self._trades_total,
-            fee_paid_total=self._fee_paid_total,
+            fee_paid_total=_to_decimal(self._fee_paid_total),
         )
 
-    def flatten_symbol(self, symbol: str, fill_price: Decimal) -> PaperFill | None:
-        current_qty = self._position_qty.get(symbol, Decimal("0"))
-        if current_qty == 0:
+    def flatten_symbol(self, symbol: str, fill_price: Decimal | float) -> PaperFill | None:
+        pos = self._positions.get(symbol)
+        if pos is None or pos.qty == 0:
             return None
+        current_qty = pos.qty
 
-        price = max(fill_price, Decimal("0.0001"))
-        avg = self._avg_entry_price.get(symbol, Decimal("0"))
-        qty = abs(current_qty)
-        notional = qty * price
-
+        price = max(float(fill_price), _MIN_PRICE)
+        avg = pos.avg
         if current_qty > 0:
             side = "SELL"
+            qty = current_qty
             realized_delta = (price - avg) * qty
         else:
             side = "BUY"
+            qty = -current_qty
             realized_delta = (avg - price) * qty
+        notional = qty * price
 
         fee_paid = _fee_from_notional(notional, self._fee_bps)
         realized_delta_after_fee = realized_delta - fee_paid
 
-        self._position_qty[symbol] = Decimal("0")
-        self._avg_entry_price[symbol] = Decimal("0")
-        self._marks[symbol] = price
+        pos.qty = 0.0
+        pos.avg = 0.0
+        pos.mark = price
         self._realized_pnl_total += realized_delta_after_fee
         self._fee_paid_total += fee_paid
         self._trades_total += 1
 
-        self._log.info(
-            "paper_flatten symbol=%s side=%s px=%s qty=%s realized_delta=%s fee=%s realized_total=%s trades_total=%s",
-            symbol,
-            side,
-            price,
-            qty,
-            realized_delta_after_fee,
-            fee_paid,
-            self._realized_pnl_total,
-            self._trades_total,
-        )
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info(
+                "paper_flatten symbol=%s side=%s px=%s qty=%s realized_delta=%s fee=%s realized_total=%s trades_total=%s",
+                symbol,
+                side,
+                price,
+                qty,
+                realized_delta_after_fee,
+                fee_paid,
+                self._realized_pnl_total,
+                self._trades_total,
+            )
 
         return PaperFill(
             intent_id="system_flatten",
             symbol=symbol,
             side=side,
-            notional_usd=notional,
-            fill_price=price,
-            qty=qty,
-            position_qty_after=Decimal("0"),
-            avg_entry_price_after=Decimal("0"),
-            realized_pnl_delta=realized_delta_after_fee,
-            realized_pnl_total=self._realized_pnl_total,
-            fee_paid=fee_paid,
+            notional_usd=_to_decimal(notional),
+            fill_price=_to_decimal(price),
+            qty=_to_decimal(qty),
+            position_qty_after=_ZERO,
+            avg_entry_price_after=_ZERO,
+            realized_pnl_delta=_to_decimal(realized_delta_after_fee),
+            realized_pnl_total=_to_decimal(self._realized_pnl_total),
+            fee_paid=_to_decimal(fee_paid),
             status="filled",
         )
 
     def has_open_position(self, symbol: str) -> bool:
-        return self._position_qty.get(symbol, Decimal("0")) != 0
+        pos = self._positions.get(symbol)
+        return pos is not None and pos.qty != 0
+
+    def symbol_unrealized(self, symbol: str, mark: Decimal | float) -> Decimal:
+        pos = self._positions.get(symbol)
+        if pos is None or pos.qty == 0:
+            return _ZERO
+        return _to_decimal((float(mark) - pos.avg) * pos.qty)
+
 
-    def symbol_unrealized(self, symbol: str, mark: Decimal) -> Decimal:
-        qty = self._position_qty.get(symbol, Decimal("0"))
-        if qty == 0:
-            return Decimal("0")
-        avg = self._avg_entry_price.get(symbol, Decimal("0"))
-        if qty > 0:
-            return (mark - avg) * qty
-        return (avg - mark) * abs(qty)
+def _to_decimal(value: float) -> Decimal:
+    # repr() is the shortest round-tripping form, so 0.1 stays Decimal("0.1").
+    return Decimal(repr(value))
 
 
-def _weighted_avg(current_qty: Decimal, current_avg: Decimal, new_qty: Decimal, new_price: Decimal) -> Decimal:
-    total_abs = abs(current_qty) + abs(new_qty)
+def _weighted_avg(current_qty: float, current_avg: float, new_qty: float, new_price: float) -> float:
+    current_abs = -current_qty if current_qty < 0 else current_qty
+    new_abs = -new_qty if new_qty < 0 else new_qty
+    total_abs = current_abs + new_abs
     if total_abs == 0:
-        return Decimal("0")
-    return ((abs(current_qty) * current_avg) + (abs(new_qty) * new_price)) / total_abs
+        return 0.0
+    return ((current_abs * current_avg) + (new_abs * new_price)) / total_abs
 
 
-def _fee_from_notional(notional_usd: Decimal, fee_bps: int) -> Decimal:
+def _fee_from_notional(notional_usd: float, fee_bps: int) -> float:
     if fee_bps <= 0:
-        return Decimal("0")
-    return notional_usd * Decimal(fee_bps) / Decimal("10000")
+        return 0.0
+    return notional_usd * fee_bps / 10000.0
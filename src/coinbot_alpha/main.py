@@ -1,60 +1,67 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import math
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 from uuid import uuid4
 
 from coinbot_alpha.config import load_settings
-from coinbot_alpha.data.binance import BinanceSpotClient
+from coinbot_alpha.data.binance import BinanceSpotClient, BinanceSpotPoller
 from coinbot_alpha.data.polymarket_clob import ActiveClobMarket, ClobSeriesResolver, ClobYesPriceFeed
-from coinbot_alpha.execution.paper import PaperExecutor
+from coinbot_alpha.execution.paper import PaperExecutor, PaperFill
 from coinbot_alpha.risk.kill_switch import KillSwitch
 from coinbot_alpha.risk.limits import RiskEngine, RiskLimits
 from coinbot_alpha.schemas import OrderIntent, Side
 from coinbot_alpha.telemetry.alerts import AlertEvaluator, AlertThresholds
-from coinbot_alpha.telemetry.audit import TradeAuditLogger
+from coinbot_alpha.telemetry.audit import TradeAuditConfig, TradeAuditLogger
 from coinbot_alpha.telemetry.logging import setup_logging
 from coinbot_alpha.telemetry.metrics import MetricsCollector
 
 
-def _normal_cdf(x: float) -> float:
-    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+_INV_SECONDS_PER_YEAR = 1.0 / (365.0 * 24.0 * 3600.0)
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
 
 
-def _model_prob_up(spot: Decimal, strike: Decimal, time_to_expiry_s: float, sigma_annual: float) -> Decimal:
+def _prob_and_edge(
+    spot: float, strike: float, time_to_expiry_s: float, sigma_annual: float, yes_price: float
+) -> tuple[float, float]:
+    # Decision math runs in float; Decimal is only used for money at the executor/risk boundary.
     if time_to_expiry_s <= 0:
-        return Decimal("1") if spot > strike else Decimal("0")
-    t_years = max(time_to_expiry_s, 1.0) / (365.0 * 24.0 * 3600.0)
-    vol_t = sigma_annual * math.sqrt(t_years)
-    if vol_t <= 0:
-        return Decimal("0.5")
-    z = math.log(float(strike / spot)) / vol_t
-    prob = 1.0 - _normal_cdf(z)
-    return Decimal(str(max(0.0, min(1.0, prob))))
+        prob = 1.0 if spot > strike else 0.0
+    else:
+        vol_t = sigma_annual * math.sqrt(max(time_to_expiry_s, 1.0) * _INV_SECONDS_PER_YEAR)
+        if vol_t <= 0:
+            prob = 0.5
+        else:
+            # 1 - N(z) as a single erfc call; also keeps precision deep in the tail.
+            prob = 0.5 * math.erfc(math.log(strike / spot) / vol_t * _INV_SQRT2)
+            prob = max(0.0, min(1.0, prob))
+    return prob, (prob - yes_price) * 10000.0
 
 
-def _edge_bps(model_prob: Decimal, yes_price: Decimal) -> Decimal:
-    return (model_prob - yes_price) * Decimal("10000")
+# One random prefix per run plus a counter: ids stay unique across runs and restarts without
+# an os.urandom() call and hex format for every intent.
+_RUN_ID = uuid4().hex[:12]
+_intent_seq = itertools.count(1)
 
 
-def _maybe_signal_side(edge_bps: Decimal, threshold_bps: int) -> Side | None:
-    if edge_bps >= Decimal(threshold_bps):
+def _next_intent_id() -> str:
+    return f"{_RUN_ID}-{next(_intent_seq):010d}"
+
+
+def _maybe_signal_side(edge_bps: float, threshold_bps: int) -> Side | None:
+    if edge_bps >= threshold_bps:
         return Side.BUY
-    if edge_bps <= Decimal(-threshold_bps):
+    if edge_bps <= -threshold_bps:
         return Side.SELL
     return None
 
 
-def _is_updown_market(market: ActiveClobMarket) -> bool:
-    slug = market.slug.lower()
-    q = market.question.lower()
-    return "updown" in slug or "up or down" in q
-
-
 def main() -> None:
     setup_logging()
     log = logging.getLogger("coinbot_alpha.main")
@@ -62,7 +69,7 @@ def main() -> None:
 
     metrics = MetricsCollector()
     alerts = AlertEvaluator(AlertThresholds())
-    audit = TradeAuditLogger()
+    audit = TradeAuditLogger(TradeAuditConfig(linger_ms=cfg.app.audit_linger_ms))
 
     risk = RiskEngine(
         RiskLimits(
@@ -76,13 +83,21 @@ def main() -> None:
     binance = BinanceSpotClient(cfg.demo.binance_symbol)
     resolver = ClobSeriesResolver(cfg.demo.clob_api_url)
 
-    tracked: dict[str, ActiveClobMarket] = {}
-    yes_feeds: dict[str, ClobYesPriceFeed] = {}
-    tracked_lock = threading.Lock()
+    # Copy-on-write: resolver threads publish a fresh (tracked, yes_feeds) pair with a single
+    # rebinding, so the trading loop never sees one series' new market next to its old feed
+    # (or the reverse) and reads a consistent snapshot without locking. refresh_lock only
+    # serializes the resolver threads against each other so one series' update can't drop
+    # the other's.
+    market_state: tuple[dict[str, ActiveClobMarket], dict[str, ClobYesPriceFeed]] = ({}, {})
+    # Sorted series names for telemetry; rebuilt only when a new series is first tracked.
+    tracked_series: list[str] = []
+    refresh_lock = threading.Lock()
     last_signal_ts: dict[str, float] = {}
     market_open_spot: dict[str, Decimal] = {}
+    # Audit strings for values that stay fixed for a whole market window, keyed by slug.
+    strike_str_by_slug: dict[str, str] = {}
     last_seen_slug: dict[str, str] = {}
-    last_series_yes_price: dict[str, Decimal] = {}
+    last_series_yes_price: dict[str, float] = {}
     settled_slug: set[str] = set()
     position_open_ts: dict[str, float] = {}
     last_flat_ts: dict[str, float] = {}
@@ -91,6 +106,32 @@ def main() -> None:
     max_drawdown = Decimal("0")
     drawdown_soft_block = False
     drawdown_hard_triggered = False
+    # Set by the websocket feeds and the spot poller on every price change so the loop reacts
+    # to ticks instead of sleeping a fixed interval; the interval bounds the wait.
+    price_event = threading.Event()
+    loop_interval_s = cfg.app.loop_interval_ms / 1000
+    audit_enabled = cfg.app.audit_enabled
+    # Config-derived constants, built once instead of per series per tick.
+    signal_notional = Decimal(str(cfg.demo.signal_notional_usd))
+    signal_notional_str = str(signal_notional)
+    stop_loss = Decimal(str(cfg.demo.pos_stop_loss_usd))
+    take_profit = Decimal(str(cfg.demo.pos_take_profit_usd))
+    soft_limit = Decimal(str(cfg.demo.max_drawdown_soft_usd))
+    hard_limit = Decimal(str(cfg.demo.max_drawdown_hard_usd))
+    min_hold_by_series = {"5m": cfg.demo.min_hold_sec_5m, "15m": cfg.demo.min_hold_sec_15m}
+    max_hold_by_series = {"5m": cfg.demo.max_hold_sec_5m, "15m": cfg.demo.max_hold_sec_15m}
+    spot_stale_s = cfg.demo.binance_stale_sec
+    last_telemetry_at = 0.0
+    # Inputs of the last full decision pass. A tick whose spot, markets and YES prices all
+    # match skips the series loop, but a full pass still runs at least every loop interval
+    # so the time-driven exits (expiry, hold limits, cooldowns) fire on their old cadence.
+    last_eval_spot: Decimal | None = None
+    last_eval_tracked: dict[str, ActiveClobMarket] | None = None
+    last_eval_yes: tuple[float | None, ...] = ()
+    next_full_eval_s = 0.0
+    next_loop_record_s = 0.0
+    edge_snapshot: dict[str, float] = {}
+    entry_distance_snapshot: dict[str, float] = {}
 
     log.info(
         "alpha_latency_demo_start mode=%s binance_symbol=%s series_5m=%s series_15m=%s edge_bps=%s",
@@ -101,22 +142,63 @@ def main() -> None:
         cfg.demo.edge_threshold_bps,
     )
 
+    def _flatten_and_audit(
+        series: str, slug: str, symbol: str, px: float, now_s: float, status: str, **extra: object
+    ) -> PaperFill | None:
+        # Every exit path (roll, expiry, max hold, edge compress, stop/take, drawdown) flattens,
+        # resets the series' re-entry state and writes the same audit row through here.
+        fill = executor.flatten_symbol(symbol, px)
+        if fill is None:
+            return None
+        position_open_ts.pop(symbol, None)
+        last_flat_ts[series] = now_s
+        reentry_armed[series] = False
+        if audit_enabled:
+            audit.write(
+                {
+                    "intent_id": fill.intent_id,
+                    "series": series,
+                    "slug": slug,
+                    "side": fill.side,
+                    "notional_usd": str(fill.notional_usd),
+                    "yes_price": str(px),
+                    "fill_price": str(fill.fill_price),
+                    "qty": str(fill.qty),
+                    "position_qty_after": str(fill.position_qty_after),
+                    "avg_entry_price_after": str(fill.avg_entry_price_after),
+                    "realized_pnl_delta": str(fill.realized_pnl_delta),
+                    "realized_pnl_total": str(fill.realized_pnl_total),
+                    "status": status,
+                    **extra,
+                },
+                ts=now_s,
+            )
+        return fill
+
     def _refresh_market(series: str, seed_slug: str) -> None:
+        nonlocal market_state, tracked_series
         try:
             market = resolver.resolve_from_seed(seed_slug)
             if market is None:
                 return
-            with tracked_lock:
+            with refresh_lock:
+                tracked, yes_feeds = market_state
                 prev = tracked.get(series)
-                tracked[series] = market
-            if prev is None or prev.slug != market.slug:
-                with tracked_lock:
+                rolled = prev is None or prev.slug != market.slug
+                if rolled:
                     prev_feed = yes_feeds.get(series)
                     if prev_feed is not None:
                         prev_feed.stop()
-                    feed = ClobYesPriceFeed(cfg.demo.clob_ws_url, market.yes_token_id, market.yes_price)
+                    feed = ClobYesPriceFeed(
+                        cfg.demo.clob_ws_url, market.yes_token_id, market.yes_price, on_update=price_event
+                    )
                     feed.start()
-                    yes_feeds[series] = feed
+                    yes_feeds = {**yes_feeds, series: feed}
+                tracked = {**tracked, series: market}
+                market_state = (tracked, yes_feeds)
+                if prev is None:
+                    tracked_series = sorted(tracked)
+            if rolled:
                 log.info(
                     "market_roll series=%s slug=%s condition_id=%s yes_token=%s no_token=%s end=%s",
                     series,
@@ -130,66 +212,85 @@ def main() -> None:
             log.warning("market_refresh_error series=%s seed_slug=%s err=%s", series, seed_slug, exc)
 
     def _resolver_loop() -> None:
-        while True:
-            _refresh_market("5m", cfg.demo.seed_5m_slug)
-            _refresh_market("15m", cfg.demo.seed_15m_slug)
-            time.sleep(cfg.demo.market_refresh_sec)
+        series_seeds = (("5m", cfg.demo.seed_5m_slug), ("15m", cfg.demo.seed_15m_slug))
+        # Resolve every series concurrently so a refresh costs the slowest lookup, not the sum.
+        with ThreadPoolExecutor(max_workers=len(series_seeds), thread_name_prefix="market_resolver") as pool:
+            while True:
+                list(pool.map(lambda item: _refresh_market(*item), series_seeds))
+                time.sleep(cfg.demo.market_refresh_sec)
 
     thread = threading.Thread(target=_resolver_loop, name="market_resolver", daemon=True)
     thread.start()
+    spot_poller = BinanceSpotPoller(binance, cfg.demo.binance_poll_ms / 1000, on_update=price_event)
+    spot_poller.start()
 
     while True:
+        # Cleared before anything is read, so an update landing mid-tick leaves the event set
+        # and the wait at the bottom returns at once instead of sleeping a full interval.
+        price_event.clear()
         loop_start_ns = time.perf_counter_ns()
-        metrics.record_loop()
 
+        # One wall-clock read per tick; intents and audit rows share it instead of each
+        # reading the clock again.
         now_s = time.time()
-        edge_snapshot: dict[str, Decimal] = {}
-        entry_distance_snapshot: dict[str, Decimal] = {}
-
-        try:
-            spot = binance.get_price()
-        except Exception as exc:  # noqa: BLE001
-            log.warning("binance_price_error symbol=%s err=%s", cfg.demo.binance_symbol, exc)
-            time.sleep(cfg.app.loop_interval_ms / 1000)
+        # Price updates wake the loop early; the loops counter stays on interval cadence.
+        if now_s >= next_loop_record_s:
+            metrics.record_loop()
+            next_loop_record_s = now_s + loop_interval_s
+        # Per-series snapshot lines are only built when someone will see them.
+        info_enabled = log.isEnabledFor(logging.INFO)
+
+        # The spot arrives from the poller thread, so Binance latency never lands in a tick.
+        latest_spot = spot_poller.latest()
+        if latest_spot is None:
+            spot_poller.wait_ready(loop_interval_s)
+            continue
+        spot, spot_fetched_at = latest_spot
+        spot_age_s = time.monotonic() - spot_fetched_at
+        if spot_age_s > spot_stale_s:
+            log.warning("binance_price_stale symbol=%s age_s=%.1f", cfg.demo.binance_symbol, spot_age_s)
+            time.sleep(loop_interval_s)
             continue
 
-        with tracked_lock:
-            tracked_snapshot = dict(tracked)
-
-        for series, market in tracked_snapshot.items():
-            now = datetime.now(timezone.utc)
-            tte_s = max(0.0, (market.end_ts - now).total_seconds())
-            with tracked_lock:
-                feed = yes_feeds.get(series)
-            yes_px = feed.latest_price() if feed is not None else None
-            yes_price = yes_px if yes_px is not None else market.yes_price
+        # Shared by every series' decision math this tick.
+        spot_f = float(spot)
+        sigma_annual = cfg.demo.model_sigma_annual
+
+        # Read the key list before the state: series are only ever added, and the resolver
+        # publishes the state first, so every listed series is present in the snapshot.
+        series_order = tracked_series
+        tracked_snapshot, feeds_snapshot = market_state
+
+        # Read each feed once; the decision pass below uses exactly the prices compared here.
+        yes_by_series = {series: feed.latest_price() for series, feed in feeds_snapshot.items()}
+        yes_state = tuple(yes_by_series.values())
+        if (
+            now_s >= next_full_eval_s
+            or spot != last_eval_spot
+            or tracked_snapshot is not last_eval_tracked
+            or yes_state != last_eval_yes
+        ):
+            last_eval_spot = spot
+            last_eval_tracked = tracked_snapshot
+            last_eval_yes = yes_state
+            next_full_eval_s = now_s + loop_interval_s
+            edge_snapshot = {}
+            entry_distance_snapshot = {}
+            series_items = tracked_snapshot.items()
+        else:
+            series_items = ()
+
+        for series, market in series_items:
+            tte_s = max(0.0, market.end_ts_epoch - now_s)
+            yes_px = yes_by_series.get(series)
+            yes_price = yes_px if yes_px is not None else float(market.yes_price)
             symbol = f"btc_updown_{series}"
 
             prev_slug = last_seen_slug.get(series)
             if prev_slug is not None and prev_slug != market.slug:
                 close_px = last_series_yes_price.get(series, yes_price)
-                flatten_fill = executor.flatten_symbol(symbol, close_px)
+                flatten_fill = _flatten_and_audit(series, prev_slug, symbol, close_px, now_s, "flatten_roll")
                 if flatten_fill is not None:
-                    position_open_ts.pop(symbol, None)
-                    last_flat_ts[series] = now_s
-                    reentry_armed[series] = False
-                    audit.write(
-                        {
-                            "intent_id": flatten_fill.intent_id,
-                            "series": series,
-                            "slug": prev_slug,
-                            "side": flatten_fill.side,
-                            "notional_usd": str(flatten_fill.notional_usd),
-                            "yes_price": str(close_px),
-                            "fill_price": str(flatten_fill.fill_price),
-                            "qty": str(flatten_fill.qty),
-                            "position_qty_after": str(flatten_fill.position_qty_after),
-                            "avg_entry_price_after": str(flatten_fill.avg_entry_price_after),
-                            "realized_pnl_delta": str(flatten_fill.realized_pnl_delta),
-                            "realized_pnl_total": str(flatten_fill.realized_pnl_total),
-                            "status": "flatten_roll",
-                        }
-                    )
                     log.info(
                         "series_settle series=%s from_slug=%s to_slug=%s reason=roll px=%s realized_delta=%s",
                         series,
@@ -199,6 +300,7 @@ def main() -> None:
                         flatten_fill.realized_pnl_delta,
                     )
                 market_open_spot.pop(prev_slug, None)
+                strike_str_by_slug.pop(prev_slug, None)
                 # A new contract window should always start re-armed.
                 reentry_armed[series] = True
 
@@ -206,7 +308,7 @@ def main() -> None:
             last_series_yes_price[series] = yes_price
 
             model_strike = market.strike_price
-            if model_strike is None and _is_updown_market(market):
+            if model_strike is None and market.is_updown:
                 open_spot = market_open_spot.get(market.slug)
                 if open_spot is None:
                     open_spot = spot
@@ -214,41 +316,22 @@ def main() -> None:
                 model_strike = open_spot
 
             if model_strike is None:
-                log.info(
-                    "series_snapshot series=%s slug=%s spot=%s yes_px=%s strike=na tte_s=%.1f note=no_strike_parse",
-                    series,
-                    market.slug,
-                    spot,
-                    yes_price,
-                    tte_s,
-                )
+                if info_enabled:
+                    log.info(
+                        "series_snapshot series=%s slug=%s spot=%s yes_px=%s strike=na tte_s=%.1f note=no_strike_parse",
+                        series,
+                        market.slug,
+                        spot,
+                        yes_price,
+                        tte_s,
+                    )
                 continue
 
-            model_p = _model_prob_up(spot, model_strike, tte_s, cfg.demo.model_sigma_annual)
+            model_p, edge = _prob_and_edge(spot_f, float(model_strike), tte_s, sigma_annual, yes_price)
             if tte_s <= 0 and market.slug not in settled_slug:
-                flatten_fill = executor.flatten_symbol(symbol, yes_price)
+                flatten_fill = _flatten_and_audit(series, market.slug, symbol, yes_price, now_s, "flatten_expiry")
                 settled_slug.add(market.slug)
                 if flatten_fill is not None:
-                    position_open_ts.pop(symbol, None)
-                    last_flat_ts[series] = now_s
-                    reentry_armed[series] = False
-                    audit.write(
-                        {
-                            "intent_id": flatten_fill.intent_id,
-                            "series": series,
-                            "slug": market.slug,
-                            "side": flatten_fill.side,
-                            "notional_usd": str(flatten_fill.notional_usd),
-                            "yes_price": str(yes_price),
-                            "fill_price": str(flatten_fill.fill_price),
-                            "qty": str(flatten_fill.qty),
-                            "position_qty_after": str(flatten_fill.position_qty_after),
-                            "avg_entry_price_after": str(flatten_fill.avg_entry_price_after),
-                            "realized_pnl_delta": str(flatten_fill.realized_pnl_delta),
-                            "realized_pnl_total": str(flatten_fill.realized_pnl_total),
-                            "status": "flatten_expiry",
-                        }
-                    )
                     log.info(
                         "series_settle series=%s slug=%s reason=expiry px=%s realized_delta=%s",
                         series,
@@ -261,37 +344,23 @@ def main() -> None:
                 # Never trade expired markets.
                 continue
 
-            edge = _edge_bps(model_p, yes_price)
             edge_snapshot[series] = edge
-            entry_distance_snapshot[series] = Decimal(str(cfg.demo.edge_threshold_bps)) - abs(edge)
-            min_hold_sec = cfg.demo.min_hold_sec_5m if series == "5m" else cfg.demo.min_hold_sec_15m
-            max_hold_sec = cfg.demo.max_hold_sec_5m if series == "5m" else cfg.demo.max_hold_sec_15m
+            entry_distance_snapshot[series] = cfg.demo.edge_threshold_bps - abs(edge)
+            min_hold_sec = min_hold_by_series.get(series, cfg.demo.min_hold_sec_15m)
+            max_hold_sec = max_hold_by_series.get(series, cfg.demo.max_hold_sec_15m)
             if executor.has_open_position(symbol):
                 held_s = now_s - position_open_ts.get(symbol, now_s)
                 if held_s >= max_hold_sec:
-                    flatten_fill = executor.flatten_symbol(symbol, yes_price)
+                    flatten_fill = _flatten_and_audit(
+                        series,
+                        market.slug,
+                        symbol,
+                        yes_price,
+                        now_s,
+                        "flatten_max_hold",
+                        held_sec=round(held_s, 3),
+                    )
                     if flatten_fill is not None:
-                        position_open_ts.pop(symbol, None)
-                        last_flat_ts[series] = now_s
-                        reentry_armed[series] = False
-                        audit.write(
-                            {
-                                "intent_id": flatten_fill.intent_id,
-                                "series": series,
-                                "slug": market.slug,
-                                "side": flatten_fill.side,
-                                "notional_usd": str(flatten_fill.notional_usd),
-                                "yes_price": str(yes_price),
-                                "fill_price": str(flatten_fill.fill_price),
-                                "qty": str(flatten_fill.qty),
-                                "position_qty_after": str(flatten_fill.position_qty_after),
-                                "avg_entry_price_after": str(flatten_fill.avg_entry_price_after),
-                                "realized_pnl_delta": str(flatten_fill.realized_pnl_delta),
-                                "realized_pnl_total": str(flatten_fill.realized_pnl_total),
-                                "status": "flatten_max_hold",
-                                "held_sec": round(held_s, 3),
-                            }
-                        )
                         log.info(
                             "series_settle series=%s slug=%s reason=max_hold held_s=%.1f px=%s realized_delta=%s",
                             series,
@@ -303,45 +372,30 @@ def main() -> None:
                     continue
 
                 if held_s >= min_hold_sec:
-                    if abs(edge) <= Decimal(str(cfg.demo.exit_edge_bps)):
-                        flatten_fill = executor.flatten_symbol(symbol, yes_price)
+                    if abs(edge) <= cfg.demo.exit_edge_bps:
+                        flatten_fill = _flatten_and_audit(
+                            series,
+                            market.slug,
+                            symbol,
+                            yes_price,
+                            now_s,
+                            "flatten_edge_compress",
+                            edge_bps=round(edge, 2),
+                            held_sec=round(held_s, 3),
+                        )
                         if flatten_fill is not None:
-                            position_open_ts.pop(symbol, None)
-                            last_flat_ts[series] = now_s
-                            reentry_armed[series] = False
-                            audit.write(
-                                {
-                                    "intent_id": flatten_fill.intent_id,
-                                    "series": series,
-                                    "slug": market.slug,
-                                    "side": flatten_fill.side,
-                                    "notional_usd": str(flatten_fill.notional_usd),
-                                    "yes_price": str(yes_price),
-                                    "fill_price": str(flatten_fill.fill_price),
-                                    "qty": str(flatten_fill.qty),
-                                    "position_qty_after": str(flatten_fill.position_qty_after),
-                                    "avg_entry_price_after": str(flatten_fill.avg_entry_price_after),
-                                    "realized_pnl_delta": str(flatten_fill.realized_pnl_delta),
-                                    "realized_pnl_total": str(flatten_fill.realized_pnl_total),
-                                    "status": "flatten_edge_compress",
-                                    "edge_bps": round(float(edge), 2),
-                                    "held_sec": round(held_s, 3),
-                                }
-                            )
                             log.info(
                                 "series_settle series=%s slug=%s reason=edge_compress held_s=%.1f edge_bps=%s px=%s realized_delta=%s",
                                 series,
                                 market.slug,
                                 held_s,
-                                round(float(edge), 2),
+                                round(edge, 2),
                                 yes_price,
                                 flatten_fill.realized_pnl_delta,
                             )
                         continue
 
                     unrealized = executor.symbol_unrealized(symbol, yes_price)
-                    stop_loss = Decimal(str(cfg.demo.pos_stop_loss_usd))
-                    take_profit = Decimal(str(cfg.demo.pos_take_profit_usd))
                     settle_reason = ""
                     if unrealized <= -stop_loss:
                         settle_reason = "stop_loss"
@@ -349,30 +403,17 @@ def main() -> None:
                         settle_reason = "take_profit"
 
                     if settle_reason:
-                        flatten_fill = executor.flatten_symbol(symbol, yes_price)
+                        flatten_fill = _flatten_and_audit(
+                            series,
+                            market.slug,
+                            symbol,
+                            yes_price,
+                            now_s,
+                            f"flatten_{settle_reason}",
+                            unrealized_pnl_at_exit=str(unrealized),
+                            held_sec=round(held_s, 3),
+                        )
                         if flatten_fill is not None:
-                            position_open_ts.pop(symbol, None)
-                            last_flat_ts[series] = now_s
-                            reentry_armed[series] = False
-                            audit.write(
-                                {
-                                    "intent_id": flatten_fill.intent_id,
-                                    "series": series,
-                                    "slug": market.slug,
-                                    "side": flatten_fill.side,
-                                    "notional_usd": str(flatten_fill.notional_usd),
-                                    "yes_price": str(yes_price),
-                                    "fill_price": str(flatten_fill.fill_price),
-                                    "qty": str(flatten_fill.qty),
-                                    "position_qty_after": str(flatten_fill.position_qty_after),
-                                    "avg_entry_price_after": str(flatten_fill.avg_entry_price_after),
-                                    "realized_pnl_delta": str(flatten_fill.realized_pnl_delta),
-                                    "realized_pnl_total": str(flatten_fill.realized_pnl_total),
-                                    "status": f"flatten_{settle_reason}",
-                                    "unrealized_pnl_at_exit": str(unrealized),
-                                    "held_sec": round(held_s, 3),
-                                }
-                            )
                             log.info(
                                 "series_settle series=%s slug=%s reason=%s held_s=%.1f px=%s unrealized=%s realized_delta=%s",
                                 series,
@@ -387,17 +428,18 @@ def main() -> None:
 
             side = _maybe_signal_side(edge, cfg.demo.edge_threshold_bps)
 
-            log.info(
-                "series_snapshot series=%s slug=%s spot=%s strike=%s yes_px=%s model_yes=%s edge_bps=%s tte_s=%.1f",
-                series,
-                market.slug,
-                spot,
-                model_strike,
-                yes_price,
-                model_p,
-                round(float(edge), 2),
-                tte_s,
-            )
+            if info_enabled:
+                log.info(
+                    "series_snapshot series=%s slug=%s spot=%s strike=%s yes_px=%s model_yes=%s edge_bps=%s tte_s=%.1f",
+                    series,
+                    market.slug,
+                    spot,
+                    model_strike,
+                    yes_price,
+                    model_p,
+                    round(edge, 2),
+                    tte_s,
+                )
 
             if side is None:
                 continue
@@ -407,12 +449,15 @@ def main() -> None:
                 continue
             if drawdown_soft_block:
                 metrics.record_reject()
-                audit.write({"series": series, "slug": market.slug, "blocked_reason": "max_drawdown_soft"})
+                if audit_enabled:
+                    audit.write({"series": series, "slug": market.slug, "blocked_reason": "max_drawdown_soft"}, ts=now_s)
                 continue
 
-            if kill.check().active:
+            kill_state = kill.check()
+            if kill_state.active:
                 metrics.record_reject()
-                audit.write({"series": series, "slug": market.slug, "blocked_reason": kill.check().reason})
+                if audit_enabled:
+                    audit.write({"series": series, "slug": market.slug, "blocked_reason": kill_state.reason}, ts=now_s)
                 continue
 
             last_for_series = last_signal_ts.get(series, 0.0)
@@ -422,31 +467,34 @@ def main() -> None:
             if now_s - last_flat < cfg.demo.signal_cooldown_sec:
                 continue
             if not reentry_armed.get(series, True):
-                if abs(edge) <= Decimal(str(cfg.demo.reentry_arm_bps)):
+                if abs(edge) <= cfg.demo.reentry_arm_bps:
                     reentry_armed[series] = True
                 else:
                     continue
 
             intent = OrderIntent(
-                intent_id=str(uuid4()),
+                intent_id=_next_intent_id(),
                 symbol=symbol,
                 side=side,
-                notional_usd=Decimal(str(cfg.demo.signal_notional_usd)),
+                notional_usd=signal_notional,
                 slippage_bps=cfg.execution.slippage_bps,
+                ts=datetime.fromtimestamp(now_s, tz=timezone.utc),
             )
 
             decision = risk.check_and_apply(intent)
             if not decision.allowed:
                 metrics.record_reject()
-                audit.write(
-                    {
-                        "intent_id": intent.intent_id,
-                        "series": series,
-                        "slug": market.slug,
-                        "edge_bps": round(float(edge), 2),
-                        "blocked_reason": decision.reason,
-                    }
-                )
+                if audit_enabled:
+                    audit.write(
+                        {
+                            "intent_id": intent.intent_id,
+                            "series": series,
+                            "slug": market.slug,
+                            "edge_bps": round(edge, 2),
+                            "blocked_reason": decision.reason,
+                        },
+                        ts=now_s,
+                    )
                 continue
 
             fill = executor.submit(intent, yes_price)
@@ -458,36 +506,39 @@ def main() -> None:
                 position_open_ts.pop(symbol, None)
             latency_ms = (time.perf_counter_ns() - loop_start_ns) / 1_000_000
             metrics.record_submit(latency_ms)
-            audit.write(
-                {
-                    "intent_id": intent.intent_id,
-                    "series": series,
-                    "slug": market.slug,
-                    "side": intent.side.value,
-                    "notional_usd": str(intent.notional_usd),
-                    "spot": str(spot),
-                    "strike": str(model_strike),
-                    "yes_price": str(yes_price),
-                    "fill_price": str(fill.fill_price),
-                    "qty": str(fill.qty),
-                    "position_qty_after": str(fill.position_qty_after),
-                    "avg_entry_price_after": str(fill.avg_entry_price_after),
-                    "realized_pnl_delta": str(fill.realized_pnl_delta),
-                    "realized_pnl_total": str(fill.realized_pnl_total),
-                    "model_yes": str(model_p),
-                    "edge_bps": round(float(edge), 2),
-                    "submit_latency_ms": round(latency_ms, 3),
-                    "status": "submitted",
-                }
-            )
+            if audit_enabled:
+                strike_str = strike_str_by_slug.get(market.slug)
+                if strike_str is None:
+                    strike_str = strike_str_by_slug[market.slug] = str(model_strike)
+                audit.write(
+                    {
+                        "intent_id": intent.intent_id,
+                        "series": series,
+                        "slug": market.slug,
+                        "side": intent.side.value,
+                        "notional_usd": signal_notional_str,
+                        "spot": str(spot),
+                        "strike": strike_str,
+                        "yes_price": str(yes_price),
+                        "fill_price": str(fill.fill_price),
+                        "qty": str(fill.qty),
+                        "position_qty_after": str(fill.position_qty_after),
+                        "avg_entry_price_after": str(fill.avg_entry_price_after),
+                        "realized_pnl_delta": str(fill.realized_pnl_delta),
+                        "realized_pnl_total": str(fill.realized_pnl_total),
+                        "model_yes": str(model_p),
+                        "edge_bps": round(edge, 2),
+                        "submit_latency_ms": round(latency_ms, 3),
+                        "status": "submitted",
+                    },
+                    ts=now_s,
+                )
 
         snap = metrics.snapshot()
-        marks = {}
+        marks: dict[str, float] = {}
         for series, market in tracked_snapshot.items():
-            with tracked_lock:
-                feed = yes_feeds.get(series)
-            yes_px = feed.latest_price() if feed is not None else None
-            marks[f"btc_updown_{series}"] = yes_px if yes_px is not None else market.yes_price
+            yes_px = yes_by_series.get(series)
+            marks[f"btc_updown_{series}"] = yes_px if yes_px is not None else float(market.yes_price)
         ledger = executor.snapshot(marks)
         equity = ledger.realized_pnl_total + ledger.unrealized_pnl_total
         if equity_peak is None or equity > equity_peak:
@@ -496,40 +547,20 @@ def main() -> None:
         if drawdown < max_drawdown:
             max_drawdown = drawdown
 
-        soft_limit = Decimal(str(cfg.demo.max_drawdown_soft_usd))
-        hard_limit = Decimal(str(cfg.demo.max_drawdown_hard_usd))
         drawdown_soft_block = soft_limit > 0 and drawdown <= -soft_limit
         hard_breach = hard_limit > 0 and drawdown <= -hard_limit
 
         if hard_breach and not drawdown_hard_triggered:
-            for series in sorted(tracked_snapshot.keys()):
+            for series in series_order:
                 symbol = f"btc_updown_{series}"
                 close_px = marks.get(symbol)
                 if close_px is None:
                     continue
-                flatten_fill = executor.flatten_symbol(symbol, close_px)
+                flatten_fill = _flatten_and_audit(
+                    series, tracked_snapshot[series].slug, symbol, close_px, now_s, "flatten_drawdown_hard"
+                )
                 if flatten_fill is None:
                     continue
-                position_open_ts.pop(symbol, None)
-                last_flat_ts[series] = now_s
-                reentry_armed[series] = False
-                audit.write(
-                    {
-                        "intent_id": flatten_fill.intent_id,
-                        "series": series,
-                        "slug": tracked_snapshot[series].slug,
-                        "side": flatten_fill.side,
-                        "notional_usd": str(flatten_fill.notional_usd),
-                        "yes_price": str(close_px),
-                        "fill_price": str(flatten_fill.fill_price),
-                        "qty": str(flatten_fill.qty),
-                        "position_qty_after": str(flatten_fill.position_qty_after),
-                        "avg_entry_price_after": str(flatten_fill.avg_entry_price_after),
-                        "realized_pnl_delta": str(flatten_fill.realized_pnl_delta),
-                        "realized_pnl_total": str(flatten_fill.realized_pnl_total),
-                        "status": "flatten_drawdown_hard",
-                    }
-                )
                 log.info(
                     "series_settle series=%s slug=%s reason=drawdown_hard px=%s realized_delta=%s",
                     series,
@@ -552,44 +583,47 @@ def main() -> None:
         if alert_state.reject_spike_breach:
             kill.activate("reject_spike")
 
-        edge_status_parts = []
-        for series in sorted(tracked_snapshot.keys()):
-            edge = edge_snapshot.get(series)
-            dist = entry_distance_snapshot.get(series)
-            if edge is None or dist is None:
-                continue
-            edge_status_parts.append(
-                f"{series}:edge_bps={round(float(edge),2)} to_entry_bps={round(float(dist),2)}"
+        # The loop may now run on every websocket tick; keep the telemetry line at its old cadence.
+        if time.monotonic() - last_telemetry_at >= loop_interval_s:
+            last_telemetry_at = time.monotonic()
+            edge_status_parts = []
+            for series in series_order:
+                edge = edge_snapshot.get(series)
+                dist = entry_distance_snapshot.get(series)
+                if edge is None or dist is None:
+                    continue
+                edge_status_parts.append(
+                    f"{series}:edge_bps={round(edge, 2)} to_entry_bps={round(dist, 2)}"
+                )
+            edge_status = "; ".join(edge_status_parts) if edge_status_parts else "na"
+
+            log.info(
+                "telemetry_snapshot loops=%s submits=%s rejects=%s reject_rate=%.4f p95_submit_ms=%s kill_switch=%s tracked=%s pnl_realized=%s pnl_unrealized=%s equity=%s equity_peak=%s drawdown=%s max_drawdown=%s drawdown_soft_block=%s drawdown_hard_triggered=%s open_positions=%s trades_total=%s fee_paid_total=%s entry_edge_bps=%s exit_edge_bps=%s reentry_arm_bps=%s edge_status=%s",
+                snap.loops,
+                snap.submits,
+                snap.rejects,
+                snap.reject_rate,
+                (snap.decision_to_submit_ms.p95 if snap.decision_to_submit_ms else None),
+                kill.check().active,
+                series_order,
+                ledger.realized_pnl_total,
+                ledger.unrealized_pnl_total,
+                equity,
+                equity_peak,
+                drawdown,
+                max_drawdown,
+                drawdown_soft_block,
+                drawdown_hard_triggered,
+                ledger.open_positions,
+                ledger.trades_total,
+                ledger.fee_paid_total,
+                cfg.demo.edge_threshold_bps,
+                cfg.demo.exit_edge_bps,
+                cfg.demo.reentry_arm_bps,
+                edge_status,
             )
-        edge_status = "; ".join(edge_status_parts) if edge_status_parts else "na"
-
-        log.info(
-            "telemetry_snapshot loops=%s submits=%s rejects=%s reject_rate=%.4f p95_submit_ms=%s kill_switch=%s tracked=%s pnl_realized=%s pnl_unrealized=%s equity=%s equity_peak=%s drawdown=%s max_drawdown=%s drawdown_soft_block=%s drawdown_hard_triggered=%s open_positions=%s trades_total=%s fee_paid_total=%s entry_edge_bps=%s exit_edge_bps=%s reentry_arm_bps=%s edge_status=%s",
-            snap.loops,
-            snap.submits,
-            snap.rejects,
-            snap.reject_rate,
-            (snap.decision_to_submit_ms.p95 if snap.decision_to_submit_ms else None),
-            kill.check().active,
-            sorted(tracked_snapshot.keys()),
-            ledger.realized_pnl_total,
-            ledger.unrealized_pnl_total,
-            equity,
-            equity_peak,
-            drawdown,
-            max_drawdown,
-            drawdown_soft_block,
-            drawdown_hard_triggered,
-            ledger.open_positions,
-            ledger.trades_total,
-            ledger.fee_paid_total,
-            cfg.demo.edge_threshold_bps,
-            cfg.demo.exit_edge_bps,
-            cfg.demo.reentry_arm_bps,
-            edge_status,
-        )
 
-        time.sleep(cfg.app.loop_interval_ms / 1000)
+        price_event.wait(timeout=loop_interval_s)
 
 
 if __name__ == "__main__":
@@ -1,25 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass
-class KillSwitchState:
+class KillSwitchState(NamedTuple):
     active: bool = False
     reason: str = ""
 
 
+_INACTIVE = KillSwitchState()
+
+
 class KillSwitch:
     def __init__(self) -> None:
-        self._state = KillSwitchState()
+        self._state = _INACTIVE
 
     def activate(self, reason: str) -> None:
-        self._state.active = True
-        self._state.reason = reason
+        self._state = KillSwitchState(True, reason)
 
     def deactivate(self) -> None:
-        self._state.active = False
-        self._state.reason = ""
+        self._state = _INACTIVE
 
     def check(self) -> KillSwitchState:
-        return KillSwitchState(active=self._state.active, reason=self._state.reason)
+        # The state is immutable and replaced wholesale, so callers can share it.
+        return self._state
@@ -6,29 +6,39 @@ from decimal import Decimal
 from coinbot_alpha.schemas import OrderIntent, RiskDecision
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskLimits:
     max_notional_per_symbol_usd: Decimal
     max_daily_notional_usd: Decimal
 
 
+# Notional accounting runs in integer micro-dollars; Decimal only appears on the way in.
+_MICROS = 1_000_000
+
+
+def _to_micros(usd: Decimal) -> int:
+    return int(usd * _MICROS)
+
+
 class RiskEngine:
     def __init__(self, limits: RiskLimits) -> None:
         self._limits = limits
-        self._daily_notional = Decimal("0")
-        self._symbol_notional: dict[str, Decimal] = {}
+        self._symbol_cap_micros = _to_micros(limits.max_notional_per_symbol_usd)
+        self._daily_cap_micros = _to_micros(limits.max_daily_notional_usd)
+        self._daily_notional_micros = 0
+        self._symbol_notional_micros: dict[str, int] = {}
 
     def check_and_apply(self, intent: OrderIntent) -> RiskDecision:
         sym = intent.symbol
-        sym_current = self._symbol_notional.get(sym, Decimal("0"))
-        sym_next = sym_current + intent.notional_usd
-        if sym_next > self._limits.max_notional_per_symbol_usd:
+        notional = _to_micros(intent.notional_usd)
+        sym_next = self._symbol_notional_micros.get(sym, 0) + notional
+        if sym_next > self._symbol_cap_micros:
             return RiskDecision(False, "symbol_cap_exceeded")
 
-        day_next = self._daily_notional + intent.notional_usd
-        if day_next > self._limits.max_daily_notional_usd:
+        day_next = self._daily_notional_micros + notional
+        if day_next > self._daily_cap_micros:
             return RiskDecision(False, "daily_cap_exceeded")
 
-        self._symbol_notional[sym] = sym_next
-        self._daily_notional = day_next
+        self._symbol_notional_micros[sym] = sym_next
+        self._daily_notional_micros = day_next
         return RiskDecision(True, "")
@@ -11,14 +11,14 @@ class Side(str, Enum):
     SELL = "SELL"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketTick:
     symbol: str
     price: Decimal
     ts: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     signal_id: str
     symbol: str
@@ -28,7 +28,7 @@ class Signal:
     ts: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderIntent:
     intent_id: str
     symbol: str
@@ -38,7 +38,7 @@ class OrderIntent:
     ts: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskDecision:
     allowed: bool
     reason: str = ""
@@ -1,12 +1,52 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import math
+import os
+import threading
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID
 
 from coinbot_alpha.schemas import MarketTick, Side, Signal
 
+_BPS_SCALE = 10000.0
+# Float rounding can leave an exact-threshold move (100 -> 100.08 at 8 bps) a hair short;
+# Decimal compared it inclusively, so the thresholds are widened by far less than any
+# price tick could move them.
+_BPS_EPSILON = 1e-9
+
+
+def _move_bps(prices: array[float], base: int, n: int, lookback: int) -> float:
+    # The ring occupies prices[base:base + lookback]. After n writes the oldest sample sits
+    # in the slot the next write will take.
+    first = prices[base + n % lookback]
+    last = prices[base + (n - 1) % lookback]
+    if first <= 0.0:
+        # NaN compares false against either threshold, so no signal fires.
+        return math.nan
+    return (last - first) / first * _BPS_SCALE
+
+
+# Signal ids are still random v4 UUIDs, but the entropy comes from one os.urandom() call per
+# batch instead of one per signal.
+_UUID_BATCH = 1024
+_uuid_lock = threading.Lock()
+_uuid_pool = b""
+_uuid_pos = 0
+
+
+def _next_signal_id() -> str:
+    global _uuid_pool, _uuid_pos
+    with _uuid_lock:
+        if _uuid_pos >= len(_uuid_pool):
+            _uuid_pool = os.urandom(16 * _UUID_BATCH)
+            _uuid_pos = 0
+        raw = _uuid_pool[_uuid_pos:_uuid_pos + 16]
+        _uuid_pos += 16
+    return str(UUID(bytes=raw, version=4))
+
 
 @dataclass
 class SimpleMomentum:
@@ -15,22 +55,73 @@ class SimpleMomentum:
     notional_usd: Decimal = Decimal("25")
 
     def __post_init__(self) -> None:
-        self._prices: dict[str, deque[Decimal]] = defaultdict(lambda: deque(maxlen=self.lookback))
+        # Structure-of-arrays across symbols: slot i owns the float64 ring
+        # prices[i * lookback:(i + 1) * lookback] and its write count writes[i].
+        # Decimal only survives at the Signal boundary.
+        self._slots: dict[str, int] = {}
+        self._prices = array("d")
+        self._writes = array("q")
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name == "threshold_bps":
+            # Both thresholds as floats, rebuilt whenever the field is assigned (including by
+            # __init__) rather than negated/converted per tick.
+            threshold = float(value)  # type: ignore[arg-type]
+            object.__setattr__(self, "_threshold", threshold - _BPS_EPSILON)
+            object.__setattr__(self, "_neg_threshold", _BPS_EPSILON - threshold)
+
+    def assign_symbol_ids(self, symbols: Iterable[str]) -> dict[str, int]:
+        # Optional: reserve slots up front so the layout follows a known symbol order.
+        for symbol in symbols:
+            self._slot(symbol)
+        return dict(self._slots)
 
     def on_tick(self, tick: MarketTick) -> Signal | None:
-        buf = self._prices[tick.symbol]
-        buf.append(tick.price)
-        if len(buf) < self.lookback:
+        slot = self._slot(tick.symbol)
+        n = self._record(slot, float(tick.price))
+        if n < self.lookback:
             return None
+        return self._signal(tick.symbol, _move_bps(self._prices, slot * self.lookback, n, self.lookback))
 
-        first = buf[0]
-        last = buf[-1]
-        if first <= 0:
-            return None
+    def on_batch(self, ticks: Iterable[MarketTick]) -> list[Signal]:
+        # Writes every tick first, then evaluates each touched symbol once on its window
+        # after the batch, so a burst yields at most one signal per symbol.
+        touched: dict[str, int] = {}
+        for tick in ticks:
+            slot = self._slot(tick.symbol)
+            self._record(slot, float(tick.price))
+            touched[tick.symbol] = slot
+
+        lookback = self.lookback
+        signals: list[Signal] = []
+        for symbol, slot in touched.items():
+            n = self._writes[slot]
+            if n < lookback:
+                continue
+            signal = self._signal(symbol, _move_bps(self._prices, slot * lookback, n, lookback))
+            if signal is not None:
+                signals.append(signal)
+        return signals
+
+    def _slot(self, symbol: str) -> int:
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = self._slots[symbol] = len(self._writes)
+            self._prices.extend(array("d", [0.0]) * self.lookback)
+            self._writes.append(0)
+        return slot
+
+    def _record(self, slot: int, price: float) -> int:
+        n = self._writes[slot]
+        self._prices[slot * self.lookback + n % self.lookback] = price
+        n += 1
+        self._writes[slot] = n
+        return n
 
-        move_bps = ((last - first) / first) * Decimal("10000")
-        if move_bps >= self.threshold_bps:
-            return Signal(str(uuid4()), tick.symbol, Side.BUY, 0.55, self.notional_usd)
-        if move_bps <= -self.threshold_bps:
-            return Signal(str(uuid4()), tick.symbol, Side.SELL, 0.55, self.notional_usd)
+    def _signal(self, symbol: str, move_bps: float) -> Signal | None:
+        if move_bps >= self._threshold:
+            return Signal(_next_signal_id(), symbol, Side.BUY, 0.55, self.notional_usd)
+        if move_bps <= self._neg_threshold:
+            return Signal(_next_signal_id(), symbol, Side.SELL, 0.55, self.notional_usd)
         return None
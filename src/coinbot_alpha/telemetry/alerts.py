@@ -1,29 +1,38 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from typing import NamedTuple
 
 from coinbot_alpha.telemetry.metrics import DashboardSnapshot
 
 
-@dataclass(frozen=True)
-class AlertThresholds:
+class AlertThresholds(NamedTuple):
     max_reject_rate: float = 0.1
     max_p95_submit_latency_ms: int = 1200
 
 
-@dataclass(frozen=True)
-class AlertState:
+class AlertState(NamedTuple):
     reject_spike_breach: bool
     p95_latency_breach: bool
 
 
 class AlertEvaluator:
     def __init__(self, thresholds: AlertThresholds) -> None:
-        self._thresholds = thresholds
-
-    def evaluate(self, snapshot: DashboardSnapshot) -> AlertState:
-        p95 = snapshot.decision_to_submit_ms.p95 if snapshot.decision_to_submit_ms else 0
-        return AlertState(
-            reject_spike_breach=snapshot.reject_rate > self._thresholds.max_reject_rate,
-            p95_latency_breach=p95 > self._thresholds.max_p95_submit_latency_ms,
+        max_reject_rate = thresholds.max_reject_rate
+        max_p95_ms = thresholds.max_p95_submit_latency_ms
+        # Only four outcomes exist; index by breach bitmask instead of building one per call.
+        states = (
+            AlertState(reject_spike_breach=False, p95_latency_breach=False),
+            AlertState(reject_spike_breach=True, p95_latency_breach=False),
+            AlertState(reject_spike_breach=False, p95_latency_breach=True),
+            AlertState(reject_spike_breach=True, p95_latency_breach=True),
         )
+
+        def evaluate(snapshot: DashboardSnapshot) -> AlertState:
+            latency = snapshot.decision_to_submit_ms
+            p95 = latency.p95 if latency is not None else 0
+            return states[(snapshot.reject_rate > max_reject_rate) | ((p95 > max_p95_ms) << 1)]
+
+        # Thresholds are fixed for the evaluator's lifetime, so evaluate() closes over them
+        # instead of reading instance attributes on every call.
+        self.evaluate: Callable[[DashboardSnapshot], AlertState] = evaluate
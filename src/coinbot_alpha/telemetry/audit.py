@@ -1,24 +1,102 @@
 from __future__ import annotations
 
-import json
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from coinbot_alpha._json import dumps
+from coinbot_alpha.telemetry.logging import format_utc_ts
+
+# Upper bound on rows serialized into one append.
+_MAX_BATCH = 256
+
 
 @dataclass(frozen=True)
 class TradeAuditConfig:
     out_dir: str = "runs/telemetry"
     jsonl_name: str = "trade_audit.jsonl"
+    # How long the writer waits for more rows after the first before appending. 0 writes
+    # whatever is queued immediately; a few ms coalesces bursts into fewer write() calls.
+    linger_ms: int = 0
 
 
 class TradeAuditLogger:
     def __init__(self, cfg: TradeAuditConfig = TradeAuditConfig()) -> None:
         self._path = Path(cfg.out_dir) / cfg.jsonl_name
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = logging.getLogger("coinbot_alpha.audit")
+        self._linger_s = cfg.linger_ms / 1000
+        # write() only enqueues; a background thread serializes and appends whatever has
+        # piled up in one go, so disk I/O never lands inside the trading loop's latency.
+        self._queue: queue.SimpleQueue[dict[str, Any] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="trade_audit", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, payload: dict[str, Any], ts: float | None = None) -> None:
+        # Stamp at call time (or with the caller's tick time, epoch seconds) so queueing
+        # delay doesn't skew the record.
+        self._queue.put({"ts": format_utc_ts(time.time() if ts is None else ts), **payload})
+
+    def close(self, timeout_s: float = 5.0) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout_s)
+
+    def _drain(self) -> None:
+        # One O_APPEND descriptor stays open across batches (only this thread touches it).
+        # Each batch is already a single joined buffer, so it goes straight to os.write() with
+        # no userspace buffer copy. O_APPEND only makes each os.write() land at end of file;
+        # if a write comes back short, the remainder is a separate append that another
+        # process's write may precede.
+        fd: int | None = None
+        try:
+            while True:
+                rows = [self._queue.get()]
+                deadline = time.monotonic() + self._linger_s
+                while len(rows) < _MAX_BATCH and rows[-1] is not None:
+                    try:
+                        rows.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            rows.append(self._queue.get(timeout=remaining))
+                        except queue.Empty:
+                            break
+                lines = [dumps(row, default=str) for row in rows if row is not None]
+                if lines:
+                    try:
+                        if fd is None:
+                            fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                        _write_all(fd, b"\n".join(lines) + b"\n")
+                    except OSError as exc:
+                        self._log.warning("audit_write_error path=%s rows=%s err=%s", self._path, len(lines), exc)
+                        # Reopen on the next batch in case the file was rotated or removed.
+                        _close_quietly(fd)
+                        fd = None
+                if any(row is None for row in rows):
+                    return
+        finally:
+            _close_quietly(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
 
-    def write(self, payload: dict[str, Any]) -> None:
-        body = {"ts": datetime.now(timezone.utc).isoformat(), **payload}
-        with self._path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(body, separators=(",", ":"), default=str) + "\n")
+def _close_quietly(fd: int | None) -> None:
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
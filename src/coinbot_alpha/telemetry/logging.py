@@ -1,30 +1,86 @@
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime, timezone
+import time
 from typing import Any
 
+from coinbot_alpha._json import dumps
+
+# (whole second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted. Rebinding one tuple
+# keeps the pair consistent when the audit writer and log listener threads both use it.
+_iso_second: tuple[int, str] = (-1, "")
+
+
+def format_utc_ts(ts_s: float) -> str:
+    # ISO 8601 with fixed-width microseconds, i.e. isoformat(timespec="microseconds") on an
+    # aware UTC datetime: unlike plain isoformat(), whole seconds still carry ".000000".
+    # Only the microseconds are rendered per call; the date/time prefix changes once a second.
+    global _iso_second
+    sec = int(ts_s)
+    # Round like datetime.fromtimestamp() does, carrying into the next second.
+    micros = round((ts_s - sec) * 1_000_000)
+    if micros == 1_000_000:
+        sec += 1
+        micros = 0
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_second = (sec, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
+        # Plain LogRecord fields live in the instance dict; reading it directly skips the
+        # attribute machinery on every record.
+        d = record.__dict__
+        # QueueHandler has already merged args into msg, so %-formatting is usually skipped.
+        msg = d["msg"]
+        if d["args"] or type(msg) is not str:
+            msg = record.getMessage()
         payload: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
-            "msg": record.getMessage(),
+            # record.created is taken at the log call, so queueing doesn't skew the stamp.
+            "ts": format_utc_ts(d["created"]),
+            "level": d["levelname"],
+            "logger": d["name"],
+            "msg": msg,
         }
-        extra = getattr(record, "extra_fields", None)
-        if isinstance(extra, dict):
-            payload.update(extra)
-        return json.dumps(payload, separators=(",", ":"))
+        # Most records carry no extra_fields; only those pay for the merge.
+        if "extra_fields" in d:
+            extra = d["extra_fields"]
+            if type(extra) is dict:
+                payload.update(extra)
+        return dumps(payload).decode("utf-8")
+
+
+_listener: logging.handlers.QueueListener | None = None
 
 
 def setup_logging(level: int = logging.INFO) -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    # Callers only enqueue; JSON formatting and the stdout write happen on the listener's
+    # thread, so a log burst never blocks the trading loop on console I/O.
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(JsonFormatter())
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, handler)
+    _listener.start()
+
     root = logging.getLogger()
     root.setLevel(level)
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+@atexit.register
+def _stop_listener() -> None:
+    # stop() drains whatever is still queued before returning.
+    if _listener is not None:
+        _listener.stop()
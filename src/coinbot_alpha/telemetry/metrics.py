@@ -1,18 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from statistics import median
+import math
+from array import array
+from typing import NamedTuple
 
+from coinbot_alpha._json import dumps
 
-@dataclass(frozen=True)
-class PercentileSummary:
+# Latency samples land in log-spaced buckets 1% wide between 1 us and 100 s, so memory is
+# one fixed array of int64 counts (~15 KiB) instead of growing with every submit.
+_BUCKET_GROWTH = 1.01
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+_MIN_TRACKED_MS = 1e-3
+_MAX_TRACKED_MS = 1e5
+_LOG_MIN = math.log(_MIN_TRACKED_MS)
+_N_BUCKETS = int((math.log(_MAX_TRACKED_MS) - _LOG_MIN) / _LOG_GROWTH) + 1
+
+
+class PercentileSummary(NamedTuple):
     p50: float
     p95: float
     p99: float
 
 
-@dataclass(frozen=True)
-class DashboardSnapshot:
+class DashboardSnapshot(NamedTuple):
     decision_to_submit_ms: PercentileSummary | None
     loops: int
     submits: int
@@ -20,49 +30,114 @@ class DashboardSnapshot:
     reject_rate: float
 
 
+# Slots in MetricsCollector's counter block.
+_LOOPS, _SUBMITS, _REJECTS = 0, 1, 2
+
+
 class MetricsCollector:
     def __init__(self) -> None:
-        self._decision_to_submit_ms: list[float] = []
-        self._loops = 0
-        self._submits = 0
-        self._rejects = 0
+        self._decision_to_submit_ms = _LogHistogram()
+        # One contiguous block of uint64 counters, updated in place and read back in a
+        # single unpack by snapshot().
+        self._counts = array("Q", [0, 0, 0])
+        # Last snapshot and the counters it was built from; polls between events reuse it.
+        self._snapshot_key: tuple[int, int, int] | None = None
+        self._snapshot: DashboardSnapshot | None = None
+        self._snapshot_blob: bytes | None = None
 
     def record_loop(self) -> None:
-        self._loops += 1
+        self._counts[_LOOPS] += 1
 
     def record_submit(self, latency_ms: float) -> None:
-        self._submits += 1
-        self._decision_to_submit_ms.append(latency_ms)
+        self._counts[_SUBMITS] += 1
+        self._decision_to_submit_ms.add(latency_ms)
 
     def record_reject(self) -> None:
-        self._rejects += 1
+        self._counts[_REJECTS] += 1
 
     def snapshot(self) -> DashboardSnapshot:
-        denom = self._submits + self._rejects
-        return DashboardSnapshot(
-            decision_to_submit_ms=_summary(self._decision_to_submit_ms),
-            loops=self._loops,
-            submits=self._submits,
-            rejects=self._rejects,
-            reject_rate=(self._rejects / denom) if denom > 0 else 0.0,
+        loops, submits, rejects = key = tuple(self._counts)
+        if key == self._snapshot_key and self._snapshot is not None:
+            return self._snapshot
+        denom = submits + rejects
+        snap = DashboardSnapshot(
+            decision_to_submit_ms=self._decision_to_submit_ms.summary(),
+            loops=loops,
+            submits=submits,
+            rejects=rejects,
+            reject_rate=(rejects / denom) if denom > 0 else 0.0,
         )
+        self._snapshot = snap
+        self._snapshot_blob = None
+        self._snapshot_key = key
+        return snap
+
+    def snapshot_bytes(self) -> bytes:
+        # Flat JSON array for dashboards: [loops, submits, rejects, reject_rate, p50, p95, p99],
+        # percentiles null before the first submit. Encoded once per distinct snapshot.
+        snap = self.snapshot()
+        blob = self._snapshot_blob
+        if blob is None:
+            latency = snap.decision_to_submit_ms
+            p50, p95, p99 = latency if latency is not None else (None, None, None)
+            blob = dumps([snap.loops, snap.submits, snap.rejects, snap.reject_rate, p50, p95, p99])
+            self._snapshot_blob = blob
+        return blob
+
+
+class _LogHistogram:
+    def __init__(self) -> None:
+        self._counts = array("q", [0]) * _N_BUCKETS
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+        # Percentiles only move when a sample arrives; the loop counter ticking alone
+        # shouldn't re-walk the buckets.
+        self._summary: PercentileSummary | None = None
+        self._summary_count = 0
+
+    def add(self, value: float) -> None:
+        self._counts[_bucket(value)] += 1
+        self._count += 1
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def summary(self) -> PercentileSummary | None:
+        if self._count == 0:
+            return None
+        if self._summary is None or self._summary_count != self._count:
+            p50, p95, p99 = self._quantiles((50, 95, 99))
+            self._summary = PercentileSummary(p50=p50, p95=p95, p99=p99)
+            self._summary_count = self._count
+        return self._summary
+
+    def _quantiles(self, percentiles: tuple[float, ...]) -> list[float]:
+        # Nearest rank (the ceil(p/100 * n)-th smallest sample), resolved for every
+        # percentile in one ascending walk over the buckets.
+        ranks = [max(1, math.ceil(p / 100 * self._count)) for p in percentiles]
+        out: list[float] = []
+        seen = 0
+        counts = self._counts
+        # Only buckets between the exact extremes can hold samples.
+        for idx in range(_bucket(self._min), _bucket(self._max) + 1):
+            seen += counts[idx]
+            while len(out) < len(ranks) and seen >= ranks[len(out)]:
+                rank = ranks[len(out)]
+                if rank == self._count:
+                    out.append(self._max)
+                elif rank == 1:
+                    out.append(self._min)
+                else:
+                    # Bucket midpoint, clamped so the exact extremes are never overshot.
+                    mid = math.exp(_LOG_MIN + (idx + 0.5) * _LOG_GROWTH)
+                    out.append(min(self._max, max(self._min, mid)))
+            if len(out) == len(ranks):
+                break
+        return out
 
 
-def _summary(values: list[float]) -> PercentileSummary | None:
-    if not values:
-        return None
-    ordered = sorted(values)
-    return PercentileSummary(
-        p50=median(ordered),
-        p95=_percentile(ordered, 95),
-        p99=_percentile(ordered, 99),
-    )
-
-
-def _percentile(sorted_values: list[float], p: float) -> float:
-    if not sorted_values:
-        return 0.0
-    if len(sorted_values) == 1:
-        return sorted_values[0]
-    index = int(round((p / 100) * (len(sorted_values) - 1)))
-    return sorted_values[max(0, min(index, len(sorted_values) - 1))]
+def _bucket(value: float) -> int:
+    clamped = min(max(value, _MIN_TRACKED_MS), _MAX_TRACKED_MS)
+    return int((math.log(clamped) - _LOG_MIN) / _LOG_GROWTH)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import unittest
+
+from coinbot_alpha.telemetry.alerts import AlertEvaluator, AlertThresholds
+from coinbot_alpha.telemetry.metrics import DashboardSnapshot, PercentileSummary
+
+
+class AlertEvaluatorTests(unittest.TestCase):
+    def test_each_breach_maps_to_its_flag(self) -> None:
+        evaluator = AlertEvaluator(AlertThresholds(max_reject_rate=0.1, max_p95_submit_latency_ms=100))
+        cases = {
+            (0.05, None): (False, False),
+            (0.5, None): (True, False),
+            (0.05, 150.0): (False, True),
+            (0.5, 150.0): (True, True),
+        }
+        for (reject_rate, p95), expected in cases.items():
+            latency = PercentileSummary(p95, p95, p95) if p95 is not None else None
+            state = evaluator.evaluate(DashboardSnapshot(latency, 1, 1, 1, reject_rate))
+            self.assertEqual((state.reject_spike_breach, state.p95_latency_breach), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
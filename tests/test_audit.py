@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+from coinbot_alpha.telemetry.audit import TradeAuditConfig, TradeAuditLogger
+
+
+class TradeAuditLoggerTests(unittest.TestCase):
+    def test_rows_are_flushed_in_order_on_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = TradeAuditLogger(TradeAuditConfig(out_dir=tmp))
+            for i in range(300):
+                audit.write({"intent_id": str(i), "px": Decimal("0.5")})
+            audit.close()
+
+            rows = [json.loads(line) for line in (Path(tmp) / "trade_audit.jsonl").read_text().splitlines()]
+            self.assertEqual([r["intent_id"] for r in rows], [str(i) for i in range(300)])
+            self.assertEqual(rows[0]["px"], "0.5")
+            self.assertIn("ts", rows[0])
+
+    def test_linger_still_writes_every_row(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            audit = TradeAuditLogger(TradeAuditConfig(out_dir=tmp, linger_ms=20))
+            for i in range(5):
+                audit.write({"intent_id": str(i)}, ts=1771549800.5)
+            audit.close()
+
+            rows = [json.loads(line) for line in (Path(tmp) / "trade_audit.jsonl").read_text().splitlines()]
+            self.assertEqual([r["intent_id"] for r in rows], [str(i) for i in range(5)])
+            self.assertEqual(rows[0]["ts"], "2026-02-20T01:10:00.500000+00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from decimal import Decimal
+
+from coinbot_alpha.data.binance import BinanceSpotPoller
+
+
+class _FakeClient:
+    symbol = "BTCUSDT"
+
+    def get_price(self) -> Decimal:
+        return Decimal("97000.5")
+
+
+class SpotPollerTests(unittest.TestCase):
+    def test_publishes_price_and_wakes_loop(self) -> None:
+        event = threading.Event()
+        poller = BinanceSpotPoller(_FakeClient(), 0.01, on_update=event)  # type: ignore[arg-type]
+        self.assertIsNone(poller.latest())
+        poller.start()
+        try:
+            self.assertTrue(poller.wait_ready(2.0))
+            latest = poller.latest()
+            assert latest is not None
+            self.assertEqual(latest[0], Decimal("97000.5"))
+            self.assertTrue(event.is_set())
+        finally:
+            poller.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
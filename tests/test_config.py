@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import os
+import unittest
+from unittest import mock
+
+from coinbot_alpha.config import load_settings, reload_settings
+
+
+class SettingsCacheTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        load_settings.cache_clear()
+
+    def test_load_settings_is_cached_until_reload(self) -> None:
+        with mock.patch.dict(os.environ, {"APP_LOOP_INTERVAL_MS": "250"}):
+            first = reload_settings()
+            self.assertIs(load_settings(), first)
+            self.assertEqual(first.app.loop_interval_ms, 250)
+
+            os.environ["APP_LOOP_INTERVAL_MS"] = "500"
+            self.assertEqual(load_settings().app.loop_interval_ms, 250)
+            self.assertEqual(reload_settings().app.loop_interval_ms, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
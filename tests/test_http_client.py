@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+from urllib.error import HTTPError
+
+from coinbot_alpha.data import http_client
+from coinbot_alpha.data.http_client import RateLimiter, _parse_retry_after
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_penalize_blocks_until_retry_after(self) -> None:
+        limiter = RateLimiter()
+        self.assertTrue(limiter.wait(max_wait_s=0.0))
+        limiter.penalize(5.0)
+        self.assertGreaterEqual(limiter.delay(), 4.0)
+        self.assertFalse(limiter.wait(max_wait_s=1.0))
+
+    def test_parse_retry_after_seconds(self) -> None:
+        self.assertEqual(_parse_retry_after("3"), 3.0)
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertIsNone(_parse_retry_after("soon"))
+
+
+
+class GetBytesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        http_client._etag_cache.clear()
+
+    def test_not_modified_reuses_cached_body(self) -> None:
+        url = "https://example.invalid/markets?slug=a"
+        responses = [(200, {"ETag": '"v1"'}, b"[1]"), (304, {}, b"")]
+        with mock.patch.object(http_client, "_request", side_effect=lambda *_: responses.pop(0)) as request:
+            self.assertEqual(http_client.get_bytes(url), b"[1]")
+            self.assertEqual(http_client.get_bytes(url), b"[1]")
+        self.assertEqual(request.call_args.args[1]["If-None-Match"], '"v1"')
+
+    def test_not_modified_without_cached_body_raises(self) -> None:
+        url = "https://example.invalid/markets?slug=b"
+        with mock.patch.object(http_client, "_request", return_value=(304, {}, b"")):
+            with self.assertRaises(HTTPError) as ctx:
+                http_client.get_bytes(url)
+        self.assertEqual(ctx.exception.code, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+import logging
+import unittest
+from datetime import datetime, timezone
+
+from coinbot_alpha.telemetry.logging import JsonFormatter, format_utc_ts
+
+
+class FormatUtcTsTests(unittest.TestCase):
+    def test_matches_isoformat_across_second_boundaries(self) -> None:
+        for ts_s in (1771549800.25, 1771549800.999999, 1771549801.5, 1771549800.000001, 1771549801.9999996):
+            expected = datetime.fromtimestamp(ts_s, tz=timezone.utc).isoformat(timespec="microseconds")
+            self.assertEqual(format_utc_ts(ts_s), expected)
+
+    def test_whole_seconds_keep_fixed_width_fraction(self) -> None:
+        formatted = format_utc_ts(1771549800.0)
+        self.assertEqual(formatted, "2026-02-20T01:10:00.000000+00:00")
+        # Plain isoformat() would drop the fraction here; readers still parse it back exactly.
+        self.assertEqual(datetime.fromisoformat(formatted), datetime.fromtimestamp(1771549800, tz=timezone.utc))
+
+
+class JsonFormatterTests(unittest.TestCase):
+    def test_formats_args_and_merges_extra_fields(self) -> None:
+        record = logging.LogRecord("coinbot", logging.INFO, __file__, 1, "px=%s", ("0.5",), None)
+        record.extra_fields = {"series": "5m"}
+        payload = json.loads(JsonFormatter().format(record))
+        self.assertEqual(payload["msg"], "px=0.5")
+        self.assertEqual(payload["series"], "5m")
+        self.assertEqual(payload["level"], "INFO")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from coinbot_alpha.telemetry.metrics import MetricsCollector
+
+
+class MetricsCollectorTests(unittest.TestCase):
+    def test_percentiles_are_within_bucket_precision(self) -> None:
+        metrics = MetricsCollector()
+        for i in range(1, 1001):
+            metrics.record_submit(i / 10)
+        summary = metrics.snapshot().decision_to_submit_ms
+        assert summary is not None
+        self.assertAlmostEqual(summary.p50, 50.0, delta=0.5)
+        self.assertAlmostEqual(summary.p95, 95.0, delta=1.0)
+        self.assertAlmostEqual(summary.p99, 99.0, delta=1.0)
+
+    def test_nearest_rank_at_even_boundaries(self) -> None:
+        metrics = MetricsCollector()
+        for value in (1.0, 2.0, 3.0, 4.0):
+            metrics.record_submit(value)
+        summary = metrics.snapshot().decision_to_submit_ms
+        assert summary is not None
+        # ceil(0.5 * 4) = 2nd smallest; the old round()-based index landed on the 3rd.
+        self.assertAlmostEqual(summary.p50, 2.0, delta=0.02)
+        self.assertEqual(summary.p99, 4.0)
+
+    def test_single_sample_is_exact(self) -> None:
+        metrics = MetricsCollector()
+        self.assertIsNone(metrics.snapshot().decision_to_submit_ms)
+        metrics.record_submit(12.34)
+        summary = metrics.snapshot().decision_to_submit_ms
+        assert summary is not None
+        self.assertEqual((summary.p50, summary.p95, summary.p99), (12.34, 12.34, 12.34))
+
+    def test_snapshot_is_reused_until_a_counter_moves(self) -> None:
+        metrics = MetricsCollector()
+        metrics.record_submit(5.0)
+        first = metrics.snapshot()
+        self.assertIs(metrics.snapshot(), first)
+        metrics.record_loop()
+        second = metrics.snapshot()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.loops, 1)
+        self.assertIs(second.decision_to_submit_ms, first.decision_to_submit_ms)
+
+    def test_snapshot_bytes_is_a_flat_json_array(self) -> None:
+        metrics = MetricsCollector()
+        self.assertEqual(json.loads(metrics.snapshot_bytes()), [0, 0, 0, 0.0, None, None, None])
+        metrics.record_submit(12.34)
+        metrics.record_reject()
+        self.assertEqual(json.loads(metrics.snapshot_bytes()), [0, 1, 1, 0.5, 12.34, 12.34, 12.34])
+
+
+if __name__ == "__main__":
+    unittest.main()
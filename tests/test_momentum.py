@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import unittest
+from decimal import Decimal
+
+from coinbot_alpha.schemas import MarketTick, Side
+from coinbot_alpha.strategy.momentum import SimpleMomentum
+
+
+class SimpleMomentumTests(unittest.TestCase):
+    def test_signals_on_move_across_the_lookback_window(self) -> None:
+        strategy = SimpleMomentum(lookback=3, threshold_bps=Decimal("10"))
+        prices = ("100", "100.05", "100.2", "100.2", "99.9")
+        signals = [strategy.on_tick(MarketTick("BTC", Decimal(px))) for px in prices]
+
+        self.assertIsNone(signals[0])
+        self.assertIsNone(signals[1])
+        # 100 -> 100.2 is +20 bps over the window.
+        self.assertEqual(signals[2].side, Side.BUY)
+        # 100.05 -> 100.2 is +15 bps; still a buy once the oldest sample has rolled off.
+        self.assertEqual(signals[3].side, Side.BUY)
+        # 100.2 -> 99.9 is about -30 bps.
+        self.assertEqual(signals[4].side, Side.SELL)
+        self.assertEqual(signals[4].target_notional_usd, Decimal("25"))
+
+    def test_symbols_keep_separate_windows(self) -> None:
+        strategy = SimpleMomentum(lookback=2, threshold_bps=Decimal("10"))
+        self.assertIsNone(strategy.on_tick(MarketTick("A", Decimal("100"))))
+        self.assertIsNone(strategy.on_tick(MarketTick("B", Decimal("50"))))
+        self.assertIsNone(strategy.on_tick(MarketTick("A", Decimal("100.01"))))
+        self.assertEqual(strategy.on_tick(MarketTick("B", Decimal("49"))).side, Side.SELL)
+
+    def test_batch_evaluates_each_symbol_once_after_writes(self) -> None:
+        strategy = SimpleMomentum(lookback=2, threshold_bps=Decimal("10"))
+        self.assertEqual(strategy.assign_symbol_ids(["A", "B"]), {"A": 0, "B": 1})
+        signals = strategy.on_batch(
+            MarketTick(symbol, Decimal(px))
+            for symbol, px in (("A", "100"), ("B", "50"), ("A", "101"), ("B", "50.01"), ("A", "102"))
+        )
+        # A's window after the batch is 101 -> 102; B moved only 2 bps.
+        self.assertEqual([(s.symbol, s.side) for s in signals], [("A", Side.BUY)])
+
+    def test_move_exactly_at_threshold_signals(self) -> None:
+        # Each move is exactly 8 bps in Decimal but lands just inside 8.0 in float.
+        cases = (("100", "100.08", Side.BUY), ("1.1", "1.10088", Side.BUY), ("100", "99.92", Side.SELL))
+        for first, last, side in cases:
+            strategy = SimpleMomentum(lookback=2, threshold_bps=Decimal("8"))
+            self.assertIsNone(strategy.on_tick(MarketTick("A", Decimal(first))))
+            signal = strategy.on_tick(MarketTick("A", Decimal(last)))
+            assert signal is not None
+            self.assertEqual(signal.side, side)
+        strategy = SimpleMomentum(lookback=2, threshold_bps=Decimal("8"))
+        strategy.on_tick(MarketTick("A", Decimal("100.08")))
+        # Just under the threshold stays quiet.
+        self.assertIsNone(strategy.on_tick(MarketTick("A", Decimal("100.1599"))))
+
+    def test_reassigned_threshold_takes_effect(self) -> None:
+        strategy = SimpleMomentum(lookback=2, threshold_bps=Decimal("10"))
+        self.assertIsNone(strategy.on_tick(MarketTick("A", Decimal("100"))))
+        self.assertIsNone(strategy.on_tick(MarketTick("A", Decimal("100.05"))))
+        strategy.threshold_bps = Decimal("3")
+        # 100.05 -> 100.1 is about +5 bps: below the old threshold, above the new one.
+        self.assertEqual(strategy.on_tick(MarketTick("A", Decimal("100.1"))).side, Side.BUY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import unittest
+from decimal import Decimal
+
+from coinbot_alpha.execution.paper import PaperExecutor
+from coinbot_alpha.schemas import OrderIntent, Side
+
+
+def _intent(side: Side, notional: str) -> OrderIntent:
+    return OrderIntent(
+        intent_id="t",
+        symbol="BTC-5M",
+        side=side,
+        notional_usd=Decimal(notional),
+        slippage_bps=0,
+    )
+
+
+class PaperExecutorTests(unittest.TestCase):
+    def test_round_trip_realizes_pnl_and_fees(self) -> None:
+        ex = PaperExecutor(fee_bps=10)
+        buy = ex.submit(_intent(Side.BUY, "10"), Decimal("0.5"))
+        self.assertEqual(buy.qty, Decimal("20.0"))
+        self.assertEqual(buy.fee_paid, Decimal("0.01"))
+        self.assertTrue(ex.has_open_position("BTC-5M"))
+        self.assertAlmostEqual(float(ex.symbol_unrealized("BTC-5M", Decimal("0.6"))), 2.0)
+
+        flat = ex.flatten_symbol("BTC-5M", Decimal("0.6"))
+        assert flat is not None
+        self.assertEqual(flat.side, "SELL")
+        self.assertEqual(flat.position_qty_after, Decimal("0"))
+        self.assertFalse(ex.has_open_position("BTC-5M"))
+
+        snap = ex.snapshot()
+        self.assertEqual(snap.trades_total, 2)
+        self.assertEqual(snap.open_positions, 0)
+        self.assertAlmostEqual(float(snap.realized_pnl_total), 2.0 - 0.01 - 0.012)
+
+    def test_partial_close_keeps_entry_price(self) -> None:
+        ex = PaperExecutor()
+        ex.submit(_intent(Side.BUY, "10"), Decimal("0.5"))
+        fill = ex.submit(_intent(Side.SELL, "5"), Decimal("0.5"))
+        self.assertEqual(fill.position_qty_after, Decimal("10.0"))
+        self.assertEqual(fill.avg_entry_price_after, Decimal("0.5"))
+
+
+if __name__ == "__main__":
+    unittest.main()
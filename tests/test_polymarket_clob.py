@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+from urllib.error import HTTPError
+
+from coinbot_alpha.data.polymarket_clob import (
+    ClobSeriesResolver,
+    ClobYesPriceFeed,
+    _normalize_gamma_market,
+    _parse_strike_price,
+    _parse_ts,
+    _to_active_clob_market,
+)
+
+GAMMA_ITEM = {
+    "slug": "btc-updown-5m-1771549800",
+    "conditionId": "0xabc",
+    "question": "Bitcoin Up or Down - February 20, 1:10AM-1:15AM ET",
+    "endDate": "2026-02-20T06:15:00Z",
+    "active": True,
+    "closed": False,
+    "outcomes": '["Up", "Down"]',
+    "outcomePrices": '["0.515", "0.485"]',
+    "clobTokenIds": '["111", "222"]',
+}
+
+
+class ParseHelpersTests(unittest.TestCase):
+    def test_parse_ts_fixed_and_general_formats(self) -> None:
+        expected = datetime(2026, 2, 20, 1, 5, tzinfo=timezone.utc)
+        self.assertEqual(_parse_ts("2026-02-20T01:05:00Z"), expected)
+        self.assertEqual(_parse_ts("2026-02-20T01:05:00+00:00"), expected)
+        self.assertIsNone(_parse_ts("2026-13-20T01:05:00Z"))
+        self.assertIsNone(_parse_ts(None))
+
+    def test_parse_strike_price(self) -> None:
+        self.assertEqual(_parse_strike_price("Will BTC be above $97,500 on Feb 20?"), Decimal("97500"))
+        self.assertEqual(_parse_strike_price("Will Bitcoin HIT 100k?"), Decimal("100000"))
+        self.assertIsNone(_parse_strike_price("Bitcoin Up or Down"))
+
+
+
+class GammaNormalizeTests(unittest.TestCase):
+    def test_gamma_market_maps_to_active_clob_market(self) -> None:
+        market = _to_active_clob_market(_normalize_gamma_market(GAMMA_ITEM))
+        assert market is not None
+        self.assertEqual(market.yes_token_id, "111")
+        self.assertEqual(market.no_token_id, "222")
+        self.assertEqual(market.yes_price, Decimal("0.515"))
+        self.assertEqual(market.no_price, Decimal("0.485"))
+        self.assertIsNone(market.strike_price)
+        self.assertEqual(market.end_ts_epoch, datetime(2026, 2, 20, 6, 15, tzinfo=timezone.utc).timestamp())
+        self.assertTrue(market.is_updown)
+
+    def test_closed_market_skips_outcome_decoding(self) -> None:
+        normalized = _normalize_gamma_market({**GAMMA_ITEM, "closed": True})
+        self.assertEqual(normalized["tokens"], [])
+        self.assertIsNone(_to_active_clob_market(normalized))
+
+
+class PriceFeedTests(unittest.TestCase):
+    def test_walk_applies_nested_quotes_in_frame_order(self) -> None:
+        feed = ClobYesPriceFeed("wss://example", "111")
+        seen: list[float] = []
+        feed._set_price = seen.append  # type: ignore[method-assign]
+        feed._consume_message(
+            '[{"asset_id": "111", "price": "0.41",'
+            ' "events": [{"asset_id": "111", "price": "0.42"}],'
+            ' "changes": [{"price": "0.43"}, {"asset_id": "222", "price": "0.44"}]},'
+            ' {"asset_id": "222", "price": "0.99"},'
+            ' {"event_type": "price_change", "changes": [{"asset_id": "111", "best_bid": "0.45"}]}]'
+        )
+        self.assertEqual(seen, [0.41, 0.42, 0.43, 0.44, 0.45])
+
+
+    def test_flat_price_change_only_updates_own_token(self) -> None:
+        feed = ClobYesPriceFeed("wss://example", "111", initial_price=Decimal("0.5"))
+        feed._consume_message('{"event_type": "price_change", "asset_id": "222", "price": "0.9"}')
+        self.assertEqual(feed.latest_price(), 0.5)
+        feed._consume_message(b'{"event_type": "price_change", "asset_id": "111", "price": "0.61"}')
+        self.assertEqual(feed.latest_price(), 0.61)
+
+    def test_flat_price_change_with_numeric_or_empty_asset_id_uses_walker_fallbacks(self) -> None:
+        feed = ClobYesPriceFeed("wss://example", "111", initial_price=Decimal("0.5"))
+        feed._consume_message('{"event_type": "price_change", "asset_id": 111, "price": "0.62"}')
+        self.assertEqual(feed.latest_price(), 0.62)
+        feed._consume_message('{"event_type": "price_change", "asset_id": "", "asset": "111", "price": "0.63"}')
+        self.assertEqual(feed.latest_price(), 0.63)
+        feed._consume_message('{"event_type": "price_change", "asset_id": null, "token_id": "111", "price": "0.64"}')
+        self.assertEqual(feed.latest_price(), 0.64)
+
+    def test_repeated_price_does_not_wake_loop(self) -> None:
+        event = threading.Event()
+        feed = ClobYesPriceFeed("wss://example", "111", initial_price=0.5, on_update=event)
+        feed._consume_message('{"event_type": "price_change", "asset_id": "111", "price": "0.50"}')
+        self.assertFalse(event.is_set())
+        feed._consume_message('{"event_type": "price_change", "asset_id": "111", "price": "0.51"}')
+        self.assertTrue(event.is_set())
+
+
+def _gamma(slug: str, closed: bool = False) -> dict:
+    return _normalize_gamma_market({**GAMMA_ITEM, "slug": slug, "closed": closed})
+
+
+class ResolveFromSeedTests(unittest.TestCase):
+    SEED = "btc-updown-5m-1771549800"
+    CANDIDATES = ["btc-updown-5m-1", "btc-updown-5m-2", "btc-updown-5m-3"]
+
+    def _resolve(self, batch, probes: dict[str, dict | None]):
+        resolver = ClobSeriesResolver("https://clob.invalid")
+        probe = mock.Mock(side_effect=lambda slug: probes.get(slug))
+        with (
+            mock.patch.object(resolver, "_candidate_slugs", return_value=list(self.CANDIDATES)),
+            mock.patch.object(resolver, "_fetch_markets_by_slugs", side_effect=batch),
+            mock.patch.object(resolver, "_fetch_market_by_slug", probe),
+            mock.patch.object(resolver, "_sampling_pages", return_value=iter(())),
+        ):
+            market = resolver.resolve_from_seed(self.SEED)
+        return market, sorted(call.args[0] for call in probe.call_args_list)
+
+    def test_full_batch_skips_probes(self) -> None:
+        batch = {slug: _gamma(slug) for slug in self.CANDIDATES}
+        market, probed = self._resolve(lambda slugs: batch, {})
+        assert market is not None
+        self.assertEqual(market.slug, "btc-updown-5m-1")
+        self.assertEqual(probed, [])
+
+    def test_partial_batch_probes_only_missing_candidates_in_priority_order(self) -> None:
+        # 1 is absent from the batch but open, so it outranks the batch's open 3.
+        batch = {
+            "btc-updown-5m-2": _gamma("btc-updown-5m-2", closed=True),
+            "btc-updown-5m-3": _gamma("btc-updown-5m-3"),
+        }
+        market, probed = self._resolve(lambda slugs: batch, {"btc-updown-5m-1": _gamma("btc-updown-5m-1")})
+        assert market is not None
+        self.assertEqual(market.slug, "btc-updown-5m-1")
+        self.assertEqual(probed, ["btc-updown-5m-1"])
+
+    def test_partial_batch_falls_back_to_batch_market_when_probes_miss(self) -> None:
+        batch = {"btc-updown-5m-2": _gamma("btc-updown-5m-2")}
+        market, probed = self._resolve(lambda slugs: batch, {})
+        assert market is not None
+        self.assertEqual(market.slug, "btc-updown-5m-2")
+        self.assertEqual(probed, ["btc-updown-5m-1"])
+
+    def test_closed_only_batch_probes_the_rest(self) -> None:
+        batch = {"btc-updown-5m-1": _gamma("btc-updown-5m-1", closed=True)}
+        market, probed = self._resolve(lambda slugs: batch, {"btc-updown-5m-3": _gamma("btc-updown-5m-3")})
+        assert market is not None
+        self.assertEqual(market.slug, "btc-updown-5m-3")
+        self.assertEqual(probed, ["btc-updown-5m-2", "btc-updown-5m-3"])
+
+    def test_rejected_batch_filter_falls_back_to_probes(self) -> None:
+        def reject(slugs):
+            raise HTTPError("https://clob.invalid/markets", 422, "Unprocessable Entity", None, None)
+
+        market, probed = self._resolve(reject, {"btc-updown-5m-2": _gamma("btc-updown-5m-2")})
+        assert market is not None
+        self.assertEqual(market.slug, "btc-updown-5m-2")
+        self.assertIn("btc-updown-5m-1", probed)
+
+
+if __name__ == "__main__":
+    unittest.main()
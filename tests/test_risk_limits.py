@@ -16,6 +16,13 @@ class RiskLimitsTests(unittest.TestCase):
         self.assertFalse(blocked.allowed)
         self.assertEqual(blocked.reason, "symbol_cap_exceeded")
 
+    def test_daily_cap_spans_symbols_and_allows_exact_fill(self) -> None:
+        engine = RiskEngine(RiskLimits(Decimal("100"), Decimal("150.5")))
+        self.assertTrue(engine.check_and_apply(OrderIntent("1", "A", Side.BUY, Decimal("100"), 10)).allowed)
+        self.assertTrue(engine.check_and_apply(OrderIntent("2", "B", Side.BUY, Decimal("50.5"), 10)).allowed)
+        blocked = engine.check_and_apply(OrderIntent("3", "C", Side.BUY, Decimal("0.01"), 10))
+        self.assertEqual(blocked.reason, "daily_cap_exceeded")
+
 
 if __name__ == "__main__":
     unittest.main()